@@ -1,13 +1,17 @@
+import asyncio
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
 from src.utils.config import settings
 from src.controllers.auth_controller import auth_router
 from src.controllers.chat_controller import chat_router
 from src.controllers.research_controller import research_router
 from src.services.database_service import db
+from src.services.serpapi_service import close_client as close_serpapi_client
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -16,11 +20,20 @@ def _is_lambda() -> bool:
     return bool(os.environ.get("AWS_LAMBDA_FUNCTION_NAME"))
 
 
+# asyncio.to_thread work (result processing, context rendering, YouTube transcripts, Celery joins)
+# shares the default executor, whose stock size is only cpu_count + 4 on small Lambda instances
+DEFAULT_EXECUTOR_WORKERS = 32
+
+
 async def lifespan(app: FastAPI):
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=DEFAULT_EXECUTOR_WORKERS, thread_name_prefix="advista")
+    )
     await db.connect()
     yield
     # In Lambda, reuse connection across warm invocations; don't disconnect
     if not _is_lambda():
+        await close_serpapi_client()
         await db.disconnect()
 
 app = FastAPI(
@@ -68,6 +81,10 @@ app.add_middleware(
     expose_headers=["*"],
 )
 
+# Reports and processed results are large, highly redundant JSON; compress anything over 1 KB.
+# Level 5 balances CPU per request against ratio. SSE responses are passed through uncompressed.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 
 
 # Include authentication routes
@@ -0,0 +1,2 @@
+-- CreateIndex
+CREATE INDEX "research_sessions_threadId_createdAt_idx" ON "research_sessions"("threadId", "createdAt" DESC);
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, HTTPException, Depends, status, Request, Response
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Depends, status, Request, Response
 from src.models.user import (
     UserCreate, UserResponse, UserSignIn, 
     VerifyCodeRequest, ForgotPasswordRequest, 
@@ -37,7 +37,7 @@ async def check_email_unique(email: str):
     if not email:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Email is required")
     try:
-        user = await auth_service.prisma.user.find_unique(where={"email": email})
+        user = await auth_service.user_repo.find_by_email(email)
         if user:
             return MessageResponse(message="Email is already taken", success=True)
         else:
@@ -47,7 +47,7 @@ async def check_email_unique(email: str):
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
 
 @auth_router.post("/signup", response_model=MessageResponse, status_code=status.HTTP_201_CREATED)
-async def signup(user_data: UserCreate):
+async def signup(user_data: UserCreate, background_tasks: BackgroundTasks):
     """Register a new user"""
     try:
         # Validate password confirmation
@@ -57,7 +57,7 @@ async def signup(user_data: UserCreate):
                 detail="Passwords do not match"
             )
         
-        result = await auth_service.create_user(user_data.email, user_data.password)
+        result = await auth_service.create_user(user_data.email, user_data.password, background_tasks)
         
         return MessageResponse(
             message=result["message"],
@@ -167,10 +167,10 @@ async def verify_email(verify_data: VerifyCodeRequest):
         )
 
 @auth_router.post("/forgot-password", response_model=MessageResponse)
-async def forgot_password(forgot_data: ForgotPasswordRequest):
+async def forgot_password(forgot_data: ForgotPasswordRequest, background_tasks: BackgroundTasks):
     """Send password reset code to user email"""
     try:
-        success = await auth_service.forgot_password(forgot_data.email)
+        success = await auth_service.forgot_password(forgot_data.email, background_tasks)
         
         if not success:
             raise HTTPException(
@@ -193,7 +193,7 @@ async def forgot_password(forgot_data: ForgotPasswordRequest):
         )
 
 @auth_router.post("/reset-password", response_model=MessageResponse)
-async def reset_password(reset_data: ResetPasswordRequest):
+async def reset_password(reset_data: ResetPasswordRequest, background_tasks: BackgroundTasks):
     """Reset user password with reset code"""
     try:
         # Validate password confirmation
@@ -206,7 +206,8 @@ async def reset_password(reset_data: ResetPasswordRequest):
         success = await auth_service.reset_password(
             reset_data.email,
             reset_data.reset_code,
-            reset_data.new_password
+            reset_data.new_password,
+            background_tasks
         )
         
         if not success:
@@ -230,10 +231,10 @@ async def reset_password(reset_data: ResetPasswordRequest):
         )
 
 @auth_router.post("/resend-verification", response_model=MessageResponse)
-async def resend_verification_code(request_data: ForgotPasswordRequest):
+async def resend_verification_code(request_data: ForgotPasswordRequest, background_tasks: BackgroundTasks):
     """Resend verification code to user email"""
     try:
-        success = await auth_service.resend_verification_code(request_data.email)
+        success = await auth_service.resend_verification_code(request_data.email, background_tasks)
         
         if not success:
             raise HTTPException(
@@ -259,7 +260,7 @@ async def resend_verification_code(request_data: ForgotPasswordRequest):
 async def get_current_user_info(current_user: str = Depends(get_current_user)):
     """Get current user information"""
     try:
-        user = await auth_service.prisma.user.find_unique(where={"email": current_user})
+        user = await auth_service.user_repo.find_by_email(current_user)
         
         if not user:
             raise HTTPException(
@@ -1,6 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException
 from src.services.chatbot_service import chatbot_service
-from src.models.research_brief import ResearchBrief
 from pydantic import BaseModel
 from fastapi.responses import StreamingResponse
 import logging
@@ -15,10 +14,6 @@ class ChatStreamRequest(BaseModel):
     message: str
 
 
-class StartResearchRequest(BaseModel):
-    research_brief: ResearchBrief
-
-
 @chat_router.post("/stream")
 async def chat_stream(request: ChatStreamRequest):
     async def event_generator():
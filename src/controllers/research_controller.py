@@ -1,94 +1,188 @@
 import asyncio
-import json
 import logging
-import os
-from typing import Optional
+import uuid
+from contextlib import aclosing
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
 
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+import aiofiles
+import aiofiles.os
+import orjson
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, TypeAdapter
 from src.models.research_brief import ResearchBrief
 from src.models.research_insights import ProcessedSearchResults
 from src.services.research_service import research_service
 from src.services.analysis_service import analysis_service
-from src.services.synthesis_service import synthesis_service
+from src.services.synthesis_service import ResearchReport, synthesis_service
 from src.services.research_session_service import research_session_service
-from src.services.database_service import db
 from src.utils.config import settings
+from src.utils.orjson_response import ORJSONResponse
 from src.services.serpapi_service import run_serp_search_async
 from src.services.youtube_service import run_youtube_research_async
 
 logger = logging.getLogger(__name__)
-# Disable by default for Lambda (ephemeral filesystem); set ENABLE_DEBUG_FILES=true locally
-save_to_json = os.environ.get("ENABLE_DEBUG_FILES", "false").lower() == "true"
+# Off by default for Lambda (ephemeral filesystem); set ENABLE_DEBUG_FILES=true locally
+save_to_json = settings.ENABLE_DEBUG_FILES
 
 class StartResearchRequest(BaseModel):
     research_brief: ResearchBrief
     threadId: str
     userId: Optional[str] = None
+    force_refresh: bool = False
+
+
+class StartResearchResponse(BaseModel):
+    """Response body for a completed research run, serialized in a single pydantic-core pass"""
+    status: str = "success"
+    message: str = "Research completed successfully"
+    session_id: str
+    brief: ResearchBrief
+    processing_summary: Dict[str, Any]
+    category_summaries: Dict[str, Dict[str, Any]]
+    total_sources: int
+    report: ResearchReport
+    resources_used: Dict[str, Any]
+
+
+# Built once at import; unfilled brief/report sections stay as explicit nulls, matching /report
+START_RESEARCH_RESPONSE_ADAPTER = TypeAdapter(StartResearchResponse)
 
 research_router = APIRouter()
 
+# Per-query engine mapping: audience & competitor use forums for sentiment; others use general search
+ENGINE_FOR_QUERY_TYPE = MappingProxyType({
+    "audience": "google_forums",
+    "competitor": "google_forums",
+    "product": "google",
+    "campaign": "google",
+    "platform": "google",
+})
+
+# Overall budget for the SerpAPI fan-out (seconds), for both the async and Celery paths
+SERP_SEARCH_TIMEOUT = 60
+
 # Category labels for resources display
-RESOURCE_SOURCE_FOR_CATEGORY = {
+RESOURCE_SOURCE_FOR_CATEGORY = MappingProxyType({
     "audience": "reddit_forums",
     "competitor": "reddit_forums",
     "product": "google",
     "campaign": "google",
     "platform": "google",
-}
+})
+
+
+# path: (st_mtime_ns, raw bytes) of the last read, so unchanged debug files are served from memory
+_debug_file_cache: Dict[str, Tuple[int, bytes]] = {}
 
 
-def _build_resources_used(processed_results, source_for_category):
+async def _read_debug_file(path: str) -> bytes:
+    """Read a local debug file, reusing the cached bytes while its mtime is unchanged."""
+    mtime_ns = (await aiofiles.os.stat(path)).st_mtime_ns
+    cached = _debug_file_cache.get(path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    async with aiofiles.open(path, "rb") as f:
+        data = await f.read()
+    _debug_file_cache[path] = (mtime_ns, data)
+    return data
+
+
+async def _write_debug_file(path: str, data: bytes) -> None:
+    """
+    Write pre-serialized bytes to a local debug file without blocking the event loop.
+    Writes go to a unique temp file that is renamed into place, so concurrent runs never
+    interleave and readers never see a partially written file.
+    """
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    async with aiofiles.open(tmp_path, "wb") as f:
+        await f.write(data)
+    await aiofiles.os.replace(tmp_path, path)
+
+
+async def _safe_serp(out: list, query: str, query_type: str, engine: str, **kwargs) -> None:
+    """Run one SerpAPI search and append its result to out; failures are logged, not raised."""
+    try:
+        out.append(await run_serp_search_async(query, query_type, engine, **kwargs))
+    except Exception as e:
+        logger.error("SerpAPI search failed for %s: %s", query_type, e)
+
+
+def _build_resources_used(all_insights, youtube_results, source_for_category=RESOURCE_SOURCE_FOR_CATEGORY):
     """Build resources_used payload for frontend Resources tab."""
     categories_resources = []
-    for insights in processed_results.get_all_insights():
-        source_label = source_for_category.get(insights.category, "google")
-        resources = [
-            {"title": r.title, "link": r.link, "source": r.source, "snippet": (r.snippet or "")[:200]}
-            for r in (insights.top_results or [])
-        ]
+    for insights in all_insights:
+        top_results = insights.top_results
+        resources = []
+        # Forum categories often come back with no organic results; skip the build entirely
+        if top_results:
+            for r in top_results:
+                snippet = r.snippet
+                resources.append({
+                    "title": r.title,
+                    "link": r.link,
+                    "source": r.source,
+                    "snippet": snippet[:200] if snippet else "",
+                })
         categories_resources.append({
             "category": insights.category,
             "query": insights.query,
-            "source": source_label,
+            "source": source_for_category.get(insights.category, "google"),
             "resources": resources,
         })
     youtube_data = None
-    if processed_results.youtube_insights:
+    if youtube_results:
+        # Built from the raw research output: processed insights only keep truncated transcripts
         youtube_data = {
-            "query": processed_results.youtube_insights.query,
+            "query": youtube_results.get("query", ""),
             "videos": [
                 {
-                    "title": v.title,
-                    "link": v.link,
-                    "channel": v.channel,
-                    "video_id": v.video_id,
-                    "published_date": v.published_date,
-                    "transcript": v.transcript,
+                    "title": v.get("title", ""),
+                    "link": v.get("link", ""),
+                    "channel": v.get("channel", ""),
+                    "video_id": v.get("video_id", ""),
+                    "published_date": v.get("published_date", ""),
+                    "transcript": v.get("transcript", ""),
                 }
-                for v in processed_results.youtube_insights.videos
+                for v in youtube_results.get("videos") or ()
             ],
             "shorts": [
                 {
-                    "title": s.title,
-                    "link": s.link,
-                    "video_id": s.video_id,
-                    "views_original": s.views_original,
-                    "transcript": s.transcript,
+                    "title": s.get("title", ""),
+                    "link": s.get("link", ""),
+                    "video_id": s.get("video_id", ""),
+                    "views_original": s.get("views_original", ""),
+                    "transcript": s.get("transcript", ""),
                 }
-                for s in processed_results.youtube_insights.shorts
+                for s in youtube_results.get("shorts") or ()
             ],
         }
     return {"categories": categories_resources, "youtube": youtube_data}
 
 
-@research_router.post("/start-research")
-async def start_research(request: StartResearchRequest):
+async def _mark_session_failed(session_id: str, error_message: str) -> None:
+    """Set a session's status to failed; a failing status write is logged, not raised"""
+    try:
+        await research_session_service.update_status(
+            session_id,
+            'failed',
+            error_message=error_message
+        )
+    except Exception as update_error:
+        logger.error("Failed to update session status: %s", update_error)
+
+
+async def _run_research_pipeline(request: StartResearchRequest) -> AsyncIterator[Tuple[str, Any]]:
     """
-    Endpoint to start research with the completed brief.
-    This will be called by the frontend after user confirms the brief.
+    Run the full research pipeline for a confirmed brief.
+    Yields (event, payload) pairs as each stage finishes; intermediate payloads are dicts and
+    the last event is "completed" carrying a StartResearchResponse.
     """
     session = None
+    completed = False
+    # Set once a path has recorded 'failed' itself, so the handler does not overwrite its timeline
+    failed_written = False
     try:
         # Validate that the brief has required fields
         if not request.research_brief.is_complete():
@@ -96,18 +190,21 @@ async def start_research(request: StartResearchRequest):
                 status_code=400,
                 detail=f"Research brief is incomplete. Missing required fields: {request.research_brief.get_missing_fields()}"
             )
-        print(request.research_brief)
+        logger.debug("brief=%r", request.research_brief)
+        # Dumped once and shared by the session row and synthesis prompts
+        brief_dict = request.research_brief.model_dump()
         
         # Create research session in database
-        logger.info(f"Starting research for thread {request.threadId}")
+        logger.info("Starting research for thread %s", request.threadId)
         user_id = request.userId if request.userId else None
         session = await research_session_service.create_session(
             thread_id=request.threadId,
             user_id=user_id,
-            research_brief=request.research_brief.model_dump(),
+            research_brief=brief_dict,
             task_ids={}
         )
         session_id = session['id']   
+        yield "session_created", {"session_id": session_id}
         
         # Generate search params from research brief
         search_params = await research_service.create_research_query(
@@ -124,39 +221,39 @@ async def start_research(request: StartResearchRequest):
             "platform": search_params.platform_specific_query,
         }
 
-        # Per-query engine mapping: audience & competitor use forums for sentiment; others use general search
-        ENGINE_FOR_QUERY_TYPE = {
-            "audience": "google_forums",
-            "competitor": "google_forums",
-            "product": "google",
-            "campaign": "google",
-            "platform": "google",
-        }
-        # TODO: remove after debugging
-        forum_types = [qt for qt, eng in ENGINE_FOR_QUERY_TYPE.items() if eng == "google_forums"]
-        qm_preview = {k: (v[:50] + "..." if v and len(str(v)) > 50 else v) for k, v in query_mapping.items()}
-        logger.info(f"[REDDIT/FORUMS] Engine mapping | forum_types={forum_types} | query_mapping={qm_preview}")
+        # Resolve (query_type, query, engine) once; empty queries are dropped here
+        resolved_queries = []
+        for query_type, query in query_mapping.items():
+            if not query:
+                logger.info("Skipping empty query for type: %s", query_type)
+                continue
+            resolved_queries.append((query_type, query, ENGINE_FOR_QUERY_TYPE.get(query_type, "google")))
+
+        if not resolved_queries:
+            await research_session_service.update_status(
+                session_id, 'failed', error_message="No search queries generated"
+            )
+            failed_written = True
+            raise HTTPException(status_code=400, detail="No search queries generated from brief.")
 
         successful_results = {}
+        # Debug file writes run in the background and are awaited before responding
+        debug_writes = []
         
         # Use Celery if enabled, otherwise use async approach (Lambda-friendly)
         if settings.ENABLE_CELERY:
             # Celery task submission approach
             from worker.celery_app import celery_app
             
-            await research_session_service.update_status(session_id, 'researching')
+            research_session_service.append_status(session_id, 'researching')
             logger.info("Submitting SerpAPI searches to Celery...")
             
             # Submit tasks to Celery (worker must accept query, query_type, engine)
             query_task_ids = {}
-            for query_type, query in query_mapping.items():
-                if not query:
-                    logger.info(f"Skipping empty query for type: {query_type}")
-                    continue
-                engine = ENGINE_FOR_QUERY_TYPE.get(query_type, "google")
+            for query_type, query, engine in resolved_queries:
                 task_data = celery_app.send_task("serpapi_search", args=[query, query_type, engine])
                 query_task_ids[query_type] = task_data.id
-                logger.info(f"Submitted SerpAPI search task for {query_type} (engine={engine}) with task ID: {task_data.id}")
+                logger.info("Submitted SerpAPI search task for %s (engine=%s) with task ID: %s", query_type, engine, task_data.id)
             
             # Save task_id to db
             await research_session_service.save_task_ids(
@@ -164,71 +261,55 @@ async def start_research(request: StartResearchRequest):
                 query_task_ids
             )
             
-            # Poll for task completion and gather results
-            logger.info("Polling for SerpAPI search task completion...")
-            max_wait_time = 60
-            poll_interval = 2
-            elapsed_time = 0
-            
-            pending_tasks = set(query_task_ids.keys())
-            
-            while pending_tasks and elapsed_time < max_wait_time:
-                await asyncio.sleep(poll_interval)
-                elapsed_time += poll_interval
-                
-                for query_type in list(pending_tasks):
-                    task_id = query_task_ids[query_type]
-                    result = celery_app.AsyncResult(task_id)
-                    
-                    if result.ready():
-                        if result.successful():
-                            task_result = result.result
-                            successful_results[query_type] = task_result
-                            logger.info(f"Celery task completed for {query_type}")
-                        else:
-                            logger.error(f"Celery task failed for {query_type}: {result.result}")
-                        pending_tasks.discard(query_type)
-            
-            if pending_tasks:
-                logger.warning(f"Some tasks did not complete within timeout: {pending_tasks}")
+            # Block on the result backend in a worker thread instead of sleep-polling each task
+            from celery.exceptions import TimeoutError as CeleryTimeoutError
+            from celery.result import ResultSet
+
+            logger.info("Waiting for SerpAPI search task completion...")
+            task_results = [(query_type, celery_app.AsyncResult(task_id)) for query_type, task_id in query_task_ids.items()]
+            result_set = ResultSet([result for _, result in task_results])
+            try:
+                await asyncio.to_thread(result_set.join_native, timeout=SERP_SEARCH_TIMEOUT, propagate=False)
+            except CeleryTimeoutError:
+                logger.warning("Some tasks did not complete within %ds", SERP_SEARCH_TIMEOUT)
+
+            for query_type, result in task_results:
+                if not result.ready():
+                    logger.warning("Celery task still pending for %s", query_type)
+                elif result.successful():
+                    successful_results[query_type] = result.result
+                    logger.info("Celery task completed for %s", query_type)
+                else:
+                    logger.error("Celery task failed for %s: %s", query_type, result.result)
         else:
             # Async approach (Lambda-friendly)
-            await research_session_service.update_status(session_id, 'researching')
+            research_session_service.append_status(session_id, 'researching')
             logger.info("Running SerpAPI searches concurrently (async)...")
             
-            tasks = [
-                run_serp_search_async(query, query_type, ENGINE_FOR_QUERY_TYPE.get(query_type, "google"))
-                for query_type, query in query_mapping.items()
-                if query
-            ]
-            # TODO: remove after debugging
-            logger.info(f"[REDDIT/FORUMS] Submitting {len(tasks)} SerpAPI tasks | forum_tasks={[qt for qt,q in query_mapping.items() if q and ENGINE_FOR_QUERY_TYPE.get(qt)=='google_forums']}")
-            if not tasks:
-                await research_session_service.update_status(
-                    session_id, 'failed', error_message="No search queries generated"
+            # Each task handles its own errors, so the group only cancels siblings on timeout
+            results = []
+            try:
+                async with asyncio.timeout(SERP_SEARCH_TIMEOUT), asyncio.TaskGroup() as tg:
+                    for query_type, query, engine in resolved_queries:
+                        tg.create_task(_safe_serp(
+                            results, query, query_type, engine, force_refresh=request.force_refresh
+                        ))
+            except TimeoutError:
+                logger.warning(
+                    "SerpAPI searches timed out after %ds; continuing with %d results",
+                    SERP_SEARCH_TIMEOUT, len(results),
                 )
-                raise HTTPException(status_code=400, detail="No search queries generated from brief.")
             
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    logger.error(f"SerpAPI search failed: {result}")
-                    continue
-                if isinstance(result, dict) and "error" in result:
-                    logger.error(f"SerpAPI search error for {result.get('query_type', '?')}: {result['error']}")
+            for result in results:
+                if "error" in result:
+                    logger.error("SerpAPI search error for %s: %s", result.get('query_type', '?'), result['error'])
                     continue
                 query_type = result.get("query_type")
-                engine_used = ENGINE_FOR_QUERY_TYPE.get(query_type, "google")
                 successful_results[query_type] = {
                     "query": result["query"],
                     "results": result["results"],
                 }
-                logger.info(f"SerpAPI search completed for {query_type}")
-                # TODO: remove after debugging
-                if engine_used == "google_forums":
-                    organic = result.get("results", {}).get("organic_results", [])
-                    logger.info(f"[REDDIT/FORUMS] Forum result saved | category={query_type} | organic_count={len(organic)} | sources={list(set(r.get('source','') for r in organic[:5]))}")
+                logger.info("SerpAPI search completed for %s", query_type)
         
         if not successful_results:
             await research_session_service.update_status(
@@ -236,6 +317,7 @@ async def start_research(request: StartResearchRequest):
                 'failed',
                 error_message="All SerpAPI searches failed or timed out"
             )
+            failed_written = True
             raise HTTPException(
                 status_code=500,
                 detail="All SerpAPI searches failed or timed out."
@@ -243,203 +325,274 @@ async def start_research(request: StartResearchRequest):
 
         # Run YouTube research: top 3 videos + top 5 shorts with transcripts
         youtube_query = request.research_brief.product_name or search_params.product_search_query or "advertising"
-        # TODO: remove after debugging
-        logger.info(f"[YT] Starting YouTube research | session_id={session_id} | query={youtube_query} | product_name={request.research_brief.product_name}")
         try:
-            logger.info(f"Running YouTube research for: {youtube_query}")
-            youtube_results = await run_youtube_research_async(youtube_query)
+            logger.info("Running YouTube research for: %s", youtube_query)
+            youtube_results = await run_youtube_research_async(youtube_query, force_refresh=request.force_refresh)
             if youtube_results and "error" not in youtube_results:
                 successful_results["youtube"] = youtube_results
-                vcount = len(youtube_results.get("videos", []))
-                scount = len(youtube_results.get("shorts", []))
-                transcripts_with_content = sum(1 for v in youtube_results.get("videos", []) if v.get("transcript")) + sum(1 for s in youtube_results.get("shorts", []) if s.get("transcript"))
-                logger.info(f"YouTube: {vcount} videos, {scount} shorts")
-                # TODO: remove after debugging
-                logger.info(f"[YT] YouTube research done | videos={vcount} | shorts={scount} | transcripts_with_content={transcripts_with_content}")
+                logger.info(
+                    "YouTube: %d videos, %d shorts",
+                    len(youtube_results.get("videos", [])), len(youtube_results.get("shorts", [])),
+                )
             else:
                 logger.warning("YouTube research returned no results or error")
-                # TODO: remove after debugging
-                logger.warning(f"[YT] YouTube skipped | has_error={'error' in (youtube_results or {})} | empty={not youtube_results}")
         except Exception as e:
-            logger.warning(f"YouTube research failed (continuing without): {e}")
-            # TODO: remove after debugging
-            logger.warning(f"[YT] YouTube exception | error={e}", exc_info=True)
+            logger.warning("YouTube research failed (continuing without): %s", e)
         
-        # Save search results to database
-        await research_session_service.save_search_results(session_id, successful_results)
+        yield "researching_done", {"session_id": session_id, "categories": list(successful_results.keys())}
         
         # Save to file for debugging (optional)
         if save_to_json:
-            with open("search_results.json", "w") as f:
-                json.dump(successful_results, f, indent=2)
-            logger.info(f"Search results saved ({len(successful_results)} queries)")
+            debug_writes.append(asyncio.create_task(_write_debug_file(
+                "search_results.json", orjson.dumps(successful_results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            )))
         
         # Update status to processing
-        await research_session_service.update_status(session_id, 'processing')
+        research_session_service.append_status(session_id, 'processing')
         
-        # Process and analyze the search results
-        # TODO: Implement analysis service
-        processed_results = analysis_service.process_search_results(successful_results)
+        # Parsing every SerpAPI payload is CPU-bound; keep the event loop free for other requests
+        processed_results = await asyncio.to_thread(analysis_service.process_search_results, successful_results)
+        all_insights = processed_results.get_all_insights()
         
-        # Save processed results to database
-        await research_session_service.save_processed_results(
+        # Save raw and processed results to database in one write (the repository dumps the model)
+        await research_session_service.save_results(
             session_id,
-            processed_results.model_dump()
+            search_results=successful_results,
+            processed_results=processed_results,
         )
+
+        category_summaries = processed_results.category_summaries
+        yield "processing_done", {
+            "session_id": session_id,
+            "processing_summary": processed_results.processing_summary,
+            "category_summaries": category_summaries,
+            "total_sources": processed_results.total_sources,
+        }
         
         # Save to file for debugging (optional)
         if save_to_json:
-            with open("processed_results.json", "w") as f:
-                json.dump(processed_results.model_dump(), f, indent=2)
-            logger.info(f"Processed results saved")
-        
-        # Generate combined context for reference
-        # TODO: Implment analysis service
-        combined_context = analysis_service.get_combined_context(processed_results)
-        if save_to_json:
-            with open("research_context.txt", "w") as f:
-                f.write(combined_context)
-            logger.info("Research context saved")
+            debug_writes.append(asyncio.create_task(_write_debug_file(
+                "processed_results.json", processed_results.model_dump_json(indent=2).encode()
+            )))
+            # The combined context is only a debugging aid (synthesis builds per-section prompts)
+            combined_context = await asyncio.to_thread(analysis_service.get_combined_context, processed_results)
+            debug_writes.append(asyncio.create_task(_write_debug_file(
+                "research_context.txt", combined_context.encode()
+            )))
         
         # Update status to synthesizing
-        await research_session_service.update_status(session_id, 'synthesizing')
+        research_session_service.append_status(session_id, 'synthesizing')
         
         # Synthesize insights using LLM
         logger.info("Starting LLM synthesis...")
         research_report = await synthesis_service.synthesize_all(
             processed_results, 
-            research_brief=request.research_brief.model_dump()
+            research_brief=brief_dict
         )
         
-        # Save final report to database
-        await research_session_service.save_report(session_id, research_report.model_dump())
-
-        # Build resources_used for frontend Resources tab and DB
-        resources_used = _build_resources_used(processed_results, RESOURCE_SOURCE_FOR_CATEGORY)
-        await research_session_service.save_resources_used(session_id, resources_used)
-        
-        # Update status to completed
-        await research_session_service.update_status(session_id, 'completed')
+        # Save final report and resources_used (frontend Resources tab) and mark the session
+        # completed in one write
+        resources_used = _build_resources_used(all_insights, successful_results.get("youtube"))
+        await research_session_service.save_and_advance(
+            session_id,
+            'completed',
+            {'report': research_report, 'resources_used': resources_used},
+        )
+        completed = True
         
         # Save to file for debugging (optional)
         if save_to_json:
-            with open("research_report.json", "w") as f:
-                json.dump(research_report.model_dump(), f, indent=2)
-            logger.info("Research report saved")
+            debug_writes.append(asyncio.create_task(_write_debug_file(
+                "research_report.json", research_report.model_dump_json(indent=2).encode()
+            )))
+        if debug_writes:
+            # The session is already completed; a failed debug write must not fail the run
+            write_errors = [
+                r for r in await asyncio.gather(*debug_writes, return_exceptions=True)
+                if isinstance(r, BaseException)
+            ]
+            for write_error in write_errors:
+                logger.warning("Failed to save debug file: %r", write_error)
+            logger.info("Debug files saved (%d)", len(debug_writes) - len(write_errors))
         
-        # Build response with processing summary
-        category_summaries = {}
-        for insights in processed_results.get_all_insights():
-            category_summaries[insights.category] = analysis_service.get_category_summary(insights)
-
-        return {
-            "status": "success",
-            "message": "Research completed successfully",
-            "session_id": session_id,
-            "brief": request.research_brief.model_dump(),
-            "processing_summary": processed_results.processing_summary,
-            "category_summaries": category_summaries,
-            "total_sources": processed_results.total_sources,
-            "report": research_report.model_dump(),
-            "resources_used": resources_used,
-        }
+        yield "completed", StartResearchResponse(
+            session_id=session_id,
+            brief=request.research_brief,
+            processing_summary=processed_results.processing_summary,
+            category_summaries=category_summaries,
+            total_sources=processed_results.total_sources,
+            report=research_report,
+            resources_used=resources_used,
+        )
         
     except Exception as e:
-        logger.error(f"Error starting research: {e}")
+        logger.error("Error starting research: %s", e)
         
-        # Update session status to failed if session was created
-        if session:
-            try:
-                await research_session_service.update_status(
-                    session['id'],
-                    'failed',
-                    error_message=str(e)
-                )
-            except Exception as update_error:
-                logger.error(f"Failed to update session status: {update_error}")
+        # Mark the session failed unless it already completed or a failed status was written above
+        if session and not completed and not failed_written:
+            await _mark_session_failed(session['id'], str(e))
         
         raise HTTPException(status_code=500, detail=str(e))
+    except BaseException:
+        # A disconnected SSE client cancels the stream (CancelledError, or GeneratorExit when the
+        # generator is closed), which bypasses the handler above. The write is shielded so the
+        # session still leaves its in-progress state.
+        if session and not completed:
+            logger.warning("Research for session %s cancelled before completion", session['id'])
+            await asyncio.shield(_mark_session_failed(session['id'], "Research cancelled before completion"))
+        raise
+    finally:
+        # Status transitions are buffered per session until update_status flushes them
+        if session:
+            research_session_service.discard_status_history(session['id'])
+
+
+@research_router.post("/start-research", response_class=ORJSONResponse)
+async def start_research(request: StartResearchRequest):
+    """
+    Endpoint to start research with the completed brief.
+    This will be called by the frontend after user confirms the brief.
+    """
+    response = None
+    async for event, payload in _run_research_pipeline(request):
+        if event == "completed":
+            response = payload
+    return Response(
+        content=START_RESEARCH_RESPONSE_ADAPTER.dump_json(response),
+        media_type="application/json",
+    )
+
 
+@research_router.post("/start-research/stream")
+async def start_research_stream(request: StartResearchRequest):
+    """
+    Streaming variant of /start-research.
+    Emits server-sent events as each stage completes (session_created, researching_done,
+    processing_done, completed) so the client is not left waiting on LLM synthesis.
+    """
+    if not request.research_brief.is_complete():
+        raise HTTPException(
+            status_code=400,
+            detail=f"Research brief is incomplete. Missing required fields: {request.research_brief.get_missing_fields()}"
+        )
+
+    async def event_generator():
+        try:
+            # Closed explicitly so a disconnect between events still runs the pipeline's cleanup
+            async with aclosing(_run_research_pipeline(request)) as pipeline:
+                async for event, payload in pipeline:
+                    if isinstance(payload, StartResearchResponse):
+                        data = START_RESEARCH_RESPONSE_ADAPTER.dump_json(payload).decode()
+                    else:
+                        data = orjson.dumps(payload).decode()
+                    yield f"event: {event}\ndata: {data}\n\n"
+        except HTTPException as e:
+            yield f"event: error\ndata: {orjson.dumps({'detail': e.detail}).decode()}\n\n"
+
+    return StreamingResponse(event_generator(), media_type="text/event-stream")
 
-@research_router.get("/processed-results")
-async def get_processed_results():
+
+@research_router.get("/processed-results", response_class=ORJSONResponse)
+async def get_processed_results(session_id: Optional[str] = None):
     """
-    Get the processed research results.
+    Get the processed research results. When session_id is provided, fetches that
+    session's results from DB; otherwise falls back to the local debug file.
     """
     try:
+        if session_id:
+            session = await research_session_service.get_session(session_id)
+            if not session:
+                raise HTTPException(
+                    status_code=404,
+                    detail="Research session not found."
+                )
+            processed = session.get("processedResults")
+            if not processed:
+                raise HTTPException(
+                    status_code=404,
+                    detail="Processed results not found for this session."
+                )
+            return ORJSONResponse({
+                "status": "success",
+                "data": processed
+            })
+
         try:
-            with open("processed_results.json", "r") as f:
-                processed = json.load(f)
+            # Already JSON on disk: embed the bytes as-is instead of parsing and re-encoding
+            processed = orjson.Fragment(await _read_debug_file("processed_results.json"))
         except FileNotFoundError:
             raise HTTPException(
                 status_code=404,
                 detail="processed_results.json not found. Run /start-research or /process-existing first."
             )
         
-        return {
+        return ORJSONResponse({
             "status": "success",
             "data": processed
-        }
+        })
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting processed results: {e}")
+        logger.error("Error getting processed results: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@research_router.get("/report")
-async def get_research_report(session_id: Optional[str] = None):
+@research_router.get("/report", response_class=ORJSONResponse)
+async def get_research_report(request: Request, session_id: Optional[str] = None):
     """
     Get the synthesized research report. When session_id is provided, fetches from DB.
     When omitted, tries file fallback (local dev) or latest completed session from DB.
+    Completed session reports are immutable and carry an ETag for conditional requests.
     """
     try:
         if session_id:
-            session = await research_session_service.get_session(session_id)
-            if not session:
+            session_report = await research_session_service.get_report(session_id)
+            if not session_report:
                 raise HTTPException(
                     status_code=404,
                     detail="Research session not found."
                 )
-            report_data = session.get("report")
-            resources_used = session.get("resourcesUsed")
-            if not report_data:
+            report_json = session_report["report"]
+            resources_json = session_report["resources_used"]
+            if not report_json:
                 raise HTTPException(
                     status_code=404,
                     detail="Report not found for this session."
                 )
-            return {
+            cache_headers = None
+            etag = session_report["etag"]
+            if etag:
+                # Reports are per-user, so only the client may cache them
+                cache_headers = {"ETag": etag, "Cache-Control": "private, max-age=31536000, immutable"}
+                if request.headers.get("if-none-match") == etag:
+                    return Response(status_code=304, headers=cache_headers)
+            return ORJSONResponse({
                 "status": "success",
-                "report": report_data,
-                "resources_used": resources_used
-            }
+                "report": orjson.Fragment(report_json),
+                "resources_used": orjson.Fragment(resources_json) if resources_json else None
+            }, headers=cache_headers)
 
         # Fallback: try local file (dev) or latest completed session from DB
         try:
-            with open("research_report.json", "r") as f:
-                report = json.load(f)
-            return {
+            report = orjson.Fragment(await _read_debug_file("research_report.json"))
+            return ORJSONResponse({
                 "status": "success",
                 "report": report,
                 "resources_used": None
-            }
+            })
         except FileNotFoundError:
             pass
 
-        # No file: try to get latest completed session from DB
-        if not db.is_connected():
-            await db.connect()
-        session = await db.prisma.researchsession.find_first(
-            where={"status": "completed"},
-            order={"completedAt": "desc"}
-        )
-        if session:
-            session_dict = session.model_dump()
-            return {
+        # No file: try to get latest completed session from DB (report columns only)
+        latest = await research_session_service.get_latest_completed_report()
+        if latest:
+            report_json = latest.get("report")
+            resources_json = latest.get("resources_used")
+            return ORJSONResponse({
                 "status": "success",
-                "report": session_dict.get("report"),
-                "resources_used": session_dict.get("resourcesUsed")
-            }
+                "report": orjson.Fragment(report_json) if report_json else None,
+                "resources_used": orjson.Fragment(resources_json) if resources_json else None
+            })
 
         raise HTTPException(
             status_code=404,
@@ -448,5 +601,5 @@ async def get_research_report(session_id: Optional[str] = None):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting research report: {e}")
+        logger.error("Error getting research report: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
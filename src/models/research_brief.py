@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import ClassVar, List, Optional, Tuple
 
 
 class ResearchBrief(BaseModel):
@@ -13,55 +13,39 @@ class ResearchBrief(BaseModel):
     tone_and_style: str = Field("", description="Desired tone and style for creative content")
     additional_notes: str = Field("", description="Any additional context or requirements")
 
+    # Brief fields in display order, used by the completeness helpers
+    _FIELD_NAMES: ClassVar[Tuple[str, ...]] = (
+        "product_name",
+        "product_description",
+        "target_audience",
+        "competitor_names",
+        "campaign_goals",
+        "preferred_platforms",
+        "tone_and_style",
+        "additional_notes",
+    )
+
     def get_completion_percentage(self) -> float:
         """Calculate how much of the brief is complete"""
-        total_fields = 8
-        filled_fields = sum([
-            bool(self.product_name),
-            bool(self.product_description),
-            bool(self.target_audience),
-            bool(self.competitor_names),
-            bool(self.campaign_goals),
-            bool(self.preferred_platforms),
-            bool(self.tone_and_style),
-            bool(self.additional_notes),
-        ])
-        return (filled_fields / total_fields) * 100
+        # Read field values straight from __dict__ (skips attribute lookup)
+        d = self.__dict__
+        filled_fields = sum(1 for field in self._FIELD_NAMES if d[field])
+        return (filled_fields / len(self._FIELD_NAMES)) * 100
 
     def get_missing_fields(self) -> List[str]:
         """Get list of fields that are still empty"""
-        missing = []
-        if not self.product_name:
-            missing.append("product_name")
-        if not self.product_description:
-            missing.append("product_description")
-        if not self.target_audience:
-            missing.append("target_audience")
-        if not self.competitor_names:
-            missing.append("competitor_names")
-        if not self.campaign_goals:
-            missing.append("campaign_goals")
-        if not self.preferred_platforms:
-            missing.append("preferred_platforms")
-        if not self.tone_and_style:
-            missing.append("tone_and_style")
-        if not self.additional_notes:
-            missing.append("additional_notes")
-        return missing
+        d = self.__dict__
+        return [field for field in self._FIELD_NAMES if not d[field]]
 
     def is_complete(self) -> bool:
         """Check if core required fields are filled (enough to start research)"""
-        # Treat all eight fields as contributing to readiness; require 7/8
-        core_fields = [
-            bool(self.product_name),
-            bool(self.product_description),
-            bool(self.target_audience),
-            bool(self.campaign_goals),
-            bool(self.competitor_names),
-            bool(self.preferred_platforms),
-            bool(self.tone_and_style),
-            bool(self.additional_notes),
-        ]
-        # At least 7 out of 8 fields should be present
-        has_core = sum(core_fields) >= 7
-        return has_core
+        # Treat all eight fields as contributing to readiness; require 7/8,
+        # i.e. stop at the second empty field
+        d = self.__dict__
+        missing = 0
+        for field in self._FIELD_NAMES:
+            if not d[field]:
+                missing += 1
+                if missing > 1:
+                    return False
+        return True
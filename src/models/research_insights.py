@@ -1,9 +1,11 @@
 from typing import Any, Dict, List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, computed_field, model_validator
 
 
 class OrganicResult(BaseModel):
     """Represents a single organic search result"""
+    model_config = ConfigDict(frozen=True)
+
     position: int = Field(default=0, description="Position in search results")
     title: str = Field(default="", description="Title of the result")
     link: str = Field(default="", description="URL of the result")
@@ -14,6 +16,8 @@ class OrganicResult(BaseModel):
 
 class RelatedQuestion(BaseModel):
     """Represents a 'People also ask' question with answer"""
+    model_config = ConfigDict(frozen=True)
+
     question: str = Field(default="", description="The question")
     answer: str = Field(default="", description="The answer snippet")
     source_title: Optional[str] = Field(default=None, description="Source title")
@@ -22,6 +26,8 @@ class RelatedQuestion(BaseModel):
 
 class AIOverview(BaseModel):
     """Represents Google's AI-generated overview"""
+    model_config = ConfigDict(frozen=True)
+
     snippets: List[str] = Field(default_factory=list, description="AI overview text snippets")
     key_points: List[str] = Field(default_factory=list, description="Key bullet points from AI overview")
 
@@ -44,6 +50,8 @@ class CategoryInsights(BaseModel):
 
 class YouTubeVideoResult(BaseModel):
     """A YouTube video with transcript"""
+    model_config = ConfigDict(frozen=True)
+
     title: str = Field(default="", description="Video title")
     link: str = Field(default="", description="Video URL")
     channel: str = Field(default="", description="Channel name")
@@ -57,6 +65,8 @@ class YouTubeVideoResult(BaseModel):
 
 class YouTubeShortResult(BaseModel):
     """A YouTube Short with transcript"""
+    model_config = ConfigDict(frozen=True)
+
     title: str = Field(default="", description="Short title")
     link: str = Field(default="", description="Short URL")
     views: Optional[int] = Field(default=None, description="View count")
@@ -67,6 +77,8 @@ class YouTubeShortResult(BaseModel):
 
 class YouTubeInsights(BaseModel):
     """YouTube research: top videos and shorts with transcripts"""
+    model_config = ConfigDict(frozen=True)
+
     query: str = Field(default="", description="Search query used")
     videos: List[YouTubeVideoResult] = Field(default_factory=list, description="Top 3 videos with transcripts")
     shorts: List[YouTubeShortResult] = Field(default_factory=list, description="Top 5 shorts with transcripts")
@@ -74,31 +86,58 @@ class YouTubeInsights(BaseModel):
 
 class ProcessedSearchResults(BaseModel):
     """Complete processed search results across all categories"""
-    product_insights: Optional[CategoryInsights] = Field(default=None)
-    competitor_insights: Optional[CategoryInsights] = Field(default=None)
-    audience_insights: Optional[CategoryInsights] = Field(default=None)
-    campaign_insights: Optional[CategoryInsights] = Field(default=None)
-    platform_insights: Optional[CategoryInsights] = Field(default=None)
+    # Category name (product, competitor, ...): insights, in processing order.
+    # Serialized through the per-category computed fields below, so the stored JSON keeps its shape
+    insights: Dict[str, CategoryInsights] = Field(default_factory=dict, exclude=True, description="Insights keyed by category")
     youtube_insights: Optional[YouTubeInsights] = Field(default=None, description="YouTube videos and shorts with transcripts")
     
     # Metadata
     total_sources: int = Field(default=0, description="Total unique sources across all categories")
     processing_summary: Dict[str, Any] = Field(default_factory=dict, description="Processing metadata")
+    category_summaries: Dict[str, Dict[str, Any]] = Field(default_factory=dict, description="Per-category summary, filled during processing")
+
+    @model_validator(mode="before")
+    @classmethod
+    def _collect_category_insights(cls, data: Any) -> Any:
+        """Accept the serialized per-category keys (product_insights, ...) when loading stored results"""
+        if isinstance(data, dict) and "insights" not in data:
+            insights = {
+                key[:-len("_insights")]: data[key]
+                for key in ("product_insights", "competitor_insights", "audience_insights", "campaign_insights", "platform_insights")
+                if data.get(key)
+            }
+            if insights:
+                data = {**data, "insights": insights}
+        return data
+
+    @computed_field
+    @property
+    def product_insights(self) -> Optional[CategoryInsights]:
+        return self.insights.get("product")
+
+    @computed_field
+    @property
+    def competitor_insights(self) -> Optional[CategoryInsights]:
+        return self.insights.get("competitor")
+
+    @computed_field
+    @property
+    def audience_insights(self) -> Optional[CategoryInsights]:
+        return self.insights.get("audience")
+
+    @computed_field
+    @property
+    def campaign_insights(self) -> Optional[CategoryInsights]:
+        return self.insights.get("campaign")
+
+    @computed_field
+    @property
+    def platform_insights(self) -> Optional[CategoryInsights]:
+        return self.insights.get("platform")
 
     def get_all_insights(self) -> List[CategoryInsights]:
-        """Get all non-null category insights as a list"""
-        insights = []
-        if self.product_insights:
-            insights.append(self.product_insights)
-        if self.competitor_insights:
-            insights.append(self.competitor_insights)
-        if self.audience_insights:
-            insights.append(self.audience_insights)
-        if self.campaign_insights:
-            insights.append(self.campaign_insights)
-        if self.platform_insights:
-            insights.append(self.platform_insights)
-        return insights
+        """Get all category insights as a list"""
+        return list(self.insights.values())
 
     def get_all_sources(self) -> List[str]:
         """Get all unique sources across all categories"""
@@ -1,6 +1,6 @@
 from typing import Any, ClassVar, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from src.models.search_params import SearchParams
 
@@ -8,6 +8,8 @@ from src.models.search_params import SearchParams
 class SearchQueryResult(BaseModel):
     """Represents the outcome of a single SerpAPI search invocation"""
 
+    model_config = ConfigDict(frozen=True)
+
     category: str = Field(..., description="Category of the search query (product, competitor, audience, campaign, platform)")
     query: str = Field(..., description="The search query string")
     params: Dict[str, Any] = Field(default_factory=dict, description="Parameters sent to SerpAPI")
@@ -49,6 +51,8 @@ class SearchResultsCollection(BaseModel):
 class ResearchExecutionResult(BaseModel):
     """Combined payload containing generated search params and corresponding results"""
 
+    model_config = ConfigDict(frozen=True)
+
     search_params: SearchParams
     search_results: SearchResultsCollection
 
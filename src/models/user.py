@@ -1,4 +1,4 @@
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 from typing import Optional
 from datetime import datetime
 
@@ -31,11 +31,15 @@ class UserSignIn(BaseModel):
 
 
 class Token(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     access_token: str
     token_type: str = "bearer"
 
 
 class TokenData(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     email: Optional[str] = None
 
 
@@ -56,5 +60,7 @@ class ResetPasswordRequest(BaseModel):
 
 
 class MessageResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     success: bool = True
     message: str
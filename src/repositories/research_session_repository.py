@@ -1,17 +1,42 @@
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Union
 from prisma import Json
+from pydantic import BaseModel
 from src.services.database_service import db
 import logging
 
 logger = logging.getLogger(__name__)
 
+JsonPayload = Union[BaseModel, Dict[str, Any]]
+
+# update_fields / update_status fields key: Prisma JSON column
+_JSON_COLUMNS: Dict[str, str] = {
+    'research_brief': 'researchBrief',
+    'task_ids': 'taskIds',
+    'search_params': 'searchParams',
+    'search_results': 'searchResults',
+    'processed_results': 'processedResults',
+    'report': 'report',
+    'resources_used': 'resourcesUsed',
+}
+
+
+def _json(payload: Optional[JsonPayload]) -> Optional[Json]:
+    """Wrap a JSON column value; Pydantic models are dumped straight to JSON-safe data"""
+    if payload is None:
+        return None
+    if isinstance(payload, BaseModel):
+        return Json(payload.model_dump(mode='json'))
+    return Json(payload)
+
 
 class ResearchSessionRepository:
     """Repository for ResearchSession database operations"""
     
     def __init__(self):
         self.prisma = db.prisma
+        # Prisma model actions are created once per client, so the delegate can be bound here
+        self._table = self.prisma.researchsession
     
     async def create(
         self,
@@ -23,12 +48,12 @@ class ResearchSessionRepository:
     ) -> dict:
         """Create a new research session"""
         try:
-            session = await self.prisma.researchsession.create(
+            session = await self._table.create(
                 data={
                     'userId': user_id,
                     'status': status,
-                    'researchBrief': Json(research_brief) if research_brief is not None else None,
-                    'taskIds': Json(task_ids) if task_ids is not None else None,
+                    'researchBrief': _json(research_brief),
+                    'taskIds': _json(task_ids),
                     'chatSession': {
                         'connect': {
                             'threadId': thread_id,
@@ -38,60 +63,134 @@ class ResearchSessionRepository:
             )
             return session
         except Exception as e:
-            logger.error(f"Error creating research session: {e}")
+            logger.error("Error creating research session: %s", e)
             raise
     
     async def find_by_id(self, session_id: str) -> Optional[dict]:
         """Find research session by ID"""
         try:
-            session = await self.prisma.researchsession.find_unique(
+            session = await self._table.find_unique(
                 where={'id': session_id}
             )
             return session
         except Exception as e:
-            logger.error(f"Error finding research session by ID: {e}")
+            logger.error("Error finding research session by ID: %s", e)
             raise
     
     async def find_by_thread_id(self, thread_id: str) -> Optional[dict]:
         """Find latest research session by thread ID"""
         try:
-            session = await self.prisma.researchsession.find_first(
+            session = await self._table.find_first(
                 where={'threadId': thread_id},
                 order={'createdAt': 'desc'}
             )
             return session
         except Exception as e:
-            logger.error(f"Error finding research session by thread ID: {e}")
+            logger.error("Error finding research session by thread ID: %s", e)
             raise
     
+    async def find_id_by_thread_id(self, thread_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Find the id, status and createdAt of the latest research session for a thread,
+        without loading its JSON result columns
+        """
+        try:
+            return await self.prisma.query_first(
+                'SELECT id, status::text AS status, "createdAt" FROM research_sessions '
+                'WHERE "threadId" = $1 ORDER BY "createdAt" DESC LIMIT 1',
+                thread_id
+            )
+        except Exception as e:
+            logger.error("Error finding research session id by thread ID: %s", e)
+            raise
+
+    async def find_report_by_id(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch only the status, report and resourcesUsed columns of a session.
+        The JSON columns are returned as raw text so they can be forwarded without a parse.
+        """
+        try:
+            return await self.prisma.query_first(
+                'SELECT status::text AS status, report::text AS report, '
+                '"resourcesUsed"::text AS resources_used FROM research_sessions WHERE id = $1',
+                session_id
+            )
+        except Exception as e:
+            logger.error("Error finding research session report by ID: %s", e)
+            raise
+
+    async def find_latest_completed_report(self) -> Optional[Dict[str, Any]]:
+        """
+        Fetch only the report and resourcesUsed columns of the latest completed session.
+        Both are returned as raw JSON text so they can be forwarded without a parse.
+        """
+        try:
+            return await self.prisma.query_first(
+                'SELECT report::text AS report, "resourcesUsed"::text AS resources_used '
+                "FROM research_sessions WHERE status = 'completed' "
+                'ORDER BY "completedAt" DESC NULLS LAST LIMIT 1'
+            )
+        except Exception as e:
+            logger.error("Error finding latest completed report: %s", e)
+            raise
+
     async def update_status(
         self,
         session_id: str,
         status: str,
         error_message: Optional[str] = None,
-        completed_at: Optional[datetime] = None
+        completed_at: Optional[datetime] = None,
+        status_history: Optional[List[Dict[str, str]]] = None,
+        fields: Optional[Dict[str, JsonPayload]] = None
     ) -> dict:
-        """Update research session status"""
+        """
+        Update research session status, optionally setting JSON columns in the same write.
+        fields keys are snake_case, as in update_fields (e.g. report=..., resources_used=...).
+        """
         try:
             update_data = {
                 'status': status,
                 'updatedAt': datetime.utcnow(),
             }
+            if fields:
+                for name, value in fields.items():
+                    update_data[_JSON_COLUMNS[name]] = _json(value)
             
-            # error_message is not in the schema, we can put it in 'meta' if needed
+            # error_message and status_history are not in the schema, they live in 'meta'
+            meta = {}
             if error_message:
-                update_data['meta'] = Json({'errorMessage': error_message})
+                meta['errorMessage'] = error_message
+            if status_history:
+                meta['statusHistory'] = status_history
+            if meta:
+                update_data['meta'] = Json(meta)
             
             if completed_at:
                 update_data['completedAt'] = completed_at
             
-            session = await self.prisma.researchsession.update(
+            session = await self._table.update(
                 where={'id': session_id},
                 data=update_data
             )
             return session
         except Exception as e:
-            logger.error(f"Error updating session status: {e}")
+            logger.error("Error updating session status: %s", e)
+            raise
+
+    async def update_fields(self, session_id: str, **fields: Optional[JsonPayload]) -> dict:
+        """
+        Write several JSON columns in a single UPDATE.
+        Keyword names are snake_case (e.g. processed_results=..., report=...).
+        """
+        try:
+            data = {_JSON_COLUMNS[name]: _json(value) for name, value in fields.items()}
+            data['updatedAt'] = datetime.utcnow()
+            return await self._table.update(
+                where={'id': session_id},
+                data=data
+            )
+        except Exception as e:
+            logger.error("Error updating session fields %s: %s", list(fields), e)
             raise
 
     async def update_search_params(
@@ -100,120 +199,54 @@ class ResearchSessionRepository:
         search_params: Dict[str, Any]
     ) -> dict:
         """Update search params"""
-        try:
-            session = await self.prisma.researchsession.update(
-                where={'id': session_id},
-                data={
-                    'searchParams': Json(search_params) if search_params is not None else None,
-                    'updatedAt': datetime.utcnow(),
-                }
-            )
-            return session
-        except Exception as e:
-            logger.error(f"Error updating search params: {e}")
-            raise
-    
+        return await self.update_fields(session_id, search_params=search_params)
+
     async def update_search_results(
         self,
         session_id: str,
-        search_results: Dict[str, Any]
+        search_results: JsonPayload
     ) -> dict:
         """Update search results"""
-        try:
-            session = await self.prisma.researchsession.update(
-                where={'id': session_id},
-                data={
-                    'searchResults': Json(search_results) if search_results is not None else None,
-                    'updatedAt': datetime.utcnow(),
-                }
-            )
-            return session
-        except Exception as e:
-            logger.error(f"Error updating search results: {e}")
-            raise
-    
+        return await self.update_fields(session_id, search_results=search_results)
+
     async def update_processed_results(
         self,
         session_id: str,
-        processed_results: Dict[str, Any]
+        processed_results: JsonPayload
     ) -> dict:
         """Update processed results"""
-        try:
-            session = await self.prisma.researchsession.update(
-                where={'id': session_id},
-                data={
-                    'processedResults': Json(processed_results) if processed_results is not None else None,
-                    'updatedAt': datetime.utcnow(),
-                }
-            )
-            return session
-        except Exception as e:
-            logger.error(f"Error updating processed results: {e}")
-            raise
-    
+        return await self.update_fields(session_id, processed_results=processed_results)
+
     async def update_report(
         self,
         session_id: str,
-        report: Dict[str, Any]
+        report: JsonPayload
     ) -> dict:
         """Update final report"""
-        try:
-            session = await self.prisma.researchsession.update(
-                where={'id': session_id},
-                data={
-                    'report': Json(report) if report is not None else None,
-                    'updatedAt': datetime.utcnow(),
-                }
-            )
-            return session
-        except Exception as e:
-            logger.error(f"Error updating report: {e}")
-            raise
+        return await self.update_fields(session_id, report=report)
 
     async def update_resources_used(
         self,
         session_id: str,
-        resources_used: Dict[str, Any]
+        resources_used: JsonPayload
     ) -> dict:
         """Update resources used (sources, links, YouTube data for Resources tab)"""
-        try:
-            session = await self.prisma.researchsession.update(
-                where={'id': session_id},
-                data={
-                    'resourcesUsed': Json(resources_used) if resources_used is not None else None,
-                    'updatedAt': datetime.utcnow(),
-                }
-            )
-            return session
-        except Exception as e:
-            logger.error(f"Error updating resources used: {e}")
-            raise
-    
+        return await self.update_fields(session_id, resources_used=resources_used)
+
     async def update_task_ids(
         self,
         session_id: str,
         task_ids: Dict[str, str]
     ) -> dict:
         """Update task IDs"""
-        try:
-            session = await self.prisma.researchsession.update(
-                where={'id': session_id},
-                data={
-                    'taskIds': Json(task_ids) if task_ids is not None else None,
-                    'updatedAt': datetime.utcnow(),
-                }
-            )
-            return session
-        except Exception as e:
-            logger.error(f"Error updating task IDs: {e}")
-            raise
+        return await self.update_fields(session_id, task_ids=task_ids)
     
     async def delete(self, session_id: str) -> None:
         """Delete a research session"""
         try:
-            await self.prisma.researchsession.delete(where={'id': session_id})
+            await self._table.delete(where={'id': session_id})
         except Exception as e:
-            logger.error(f"Error deleting research session: {e}")
+            logger.error("Error deleting research session: %s", e)
             raise
 
 
@@ -1,6 +1,7 @@
 import logging
-from typing import Any, Dict, List, Optional
-from urllib.parse import urlparse
+import re
+from itertools import chain, islice
+from typing import Any, Dict, List, Optional, Tuple
 
 from src.models.research_insights import (
     AIOverview,
@@ -15,6 +16,21 @@ from src.models.research_insights import (
 
 logger = logging.getLogger(__name__)
 
+# Host of an http(s) URL without a leading "www." (port, path, query and fragment excluded)
+_DOMAIN_RE = re.compile(r"^https?://(?:www\.)?([^/:?#]+)", re.IGNORECASE)
+
+# SerpAPI search categories, in processing (and report) order
+SEARCH_CATEGORIES = ("product", "competitor", "audience", "campaign", "platform")
+
+# Transcript characters kept per video / short in the YouTube context
+VIDEO_TRANSCRIPT_CHARS = 2000
+SHORT_TRANSCRIPT_CHARS = 1500
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Cut text to limit characters, marking the cut with an ellipsis"""
+    return text if len(text) <= limit else text[:limit] + "..."
+
 
 class AnalysisService:
     """Service to process and analyze raw SerpAPI search results"""
@@ -34,61 +50,46 @@ class AnalysisService:
         Returns:
             ProcessedSearchResults with insights for each category
         """
-        processed = ProcessedSearchResults()
-        all_sources = set()
+        # Inputs are our own SerpAPI payloads, so models below are built with model_construct (no validation)
+        processed = ProcessedSearchResults.model_construct()
+        # Collected as a flat list and deduplicated once at the end
+        all_sources: List[str] = []
         categories_processed = 0
 
-        # Map category names to ProcessedSearchResults attributes
-        category_mapping = {
-            "product": "product_insights",
-            "competitor": "competitor_insights",
-            "audience": "audience_insights",
-            "campaign": "campaign_insights",
-            "platform": "platform_insights",
-        }
-
-        for category_key, attr_name in category_mapping.items():
-            if category_key in raw_results:
+        for category_key in SEARCH_CATEGORIES:
+            category_data = raw_results.get(category_key)
+            if category_data is not None:
                 try:
-                    category_data = raw_results[category_key]
                     insights = self._process_category(category_key, category_data)
-                    setattr(processed, attr_name, insights)
-                    all_sources.update(insights.sources)
+                    processed.insights[category_key] = insights
+                    processed.category_summaries[category_key] = self.get_category_summary(insights)
+                    all_sources.extend(insights.sources)
                     categories_processed += 1
-                    logger.info(f"Processed {category_key}: {len(insights.top_results)} results, {len(insights.related_questions)} questions")
-                    # TODO: remove after debugging (audience/competitor use google_forums/Reddit)
-                    if category_key in ("audience", "competitor"):
-                        sources_preview = list(insights.sources)[:5]
-                        logger.info(f"[REDDIT/FORUMS] Processed category={category_key} | top_results={len(insights.top_results)} | sources_sample={sources_preview}")
+                    logger.info("Processed %s: %s results, %s questions", category_key, len(insights.top_results), len(insights.related_questions))
                 except Exception as e:
-                    logger.error(f"Error processing category {category_key}: {e}")
+                    logger.error("Error processing category %s: %s", category_key, e)
 
         # Process YouTube results if present
-        if "youtube" in raw_results:
+        youtube_data = raw_results.get("youtube")
+        if youtube_data is not None:
             try:
-                youtube_data = raw_results["youtube"]
-                # TODO: remove after debugging
-                logger.info(f"[YT] Processing youtube_insights | videos={len(youtube_data.get('videos', []))} | shorts={len(youtube_data.get('shorts', []))}")
                 processed.youtube_insights = self._process_youtube(youtube_data)
-                for v in youtube_data.get("videos") or []:
-                    all_sources.add(v.get("channel") or "YouTube")
+                all_sources.extend(v.get("channel") or "YouTube" for v in youtube_data.get("videos") or ())
                 if youtube_data.get("shorts"):
-                    all_sources.add("YouTube Shorts")
+                    all_sources.append("YouTube Shorts")
                 categories_processed += 1
                 logger.info(
-                    f"Processed youtube: {len(processed.youtube_insights.videos)} videos, "
-                    f"{len(processed.youtube_insights.shorts)} shorts"
+                    "Processed youtube: %s videos, %s shorts",
+                    len(processed.youtube_insights.videos), len(processed.youtube_insights.shorts),
                 )
-                # TODO: remove after debugging
-                transcript_chars = sum(len(v.transcript) for v in processed.youtube_insights.videos) + sum(len(s.transcript) for s in processed.youtube_insights.shorts)
-                logger.info(f"[YT] youtube_insights ready | total_transcript_chars={transcript_chars}")
             except Exception as e:
-                logger.error(f"Error processing YouTube data: {e}")
+                logger.error("Error processing YouTube data: %s", e)
 
-        processed.total_sources = len(all_sources)
+        total_unique_sources = len(set(all_sources))
+        processed.total_sources = total_unique_sources
         processed.processing_summary = {
             "categories_processed": categories_processed,
-            "total_unique_sources": len(all_sources),
+            "total_unique_sources": total_unique_sources,
             "categories_available": list(raw_results.keys()),
         }
 
@@ -96,32 +97,18 @@ class AnalysisService:
 
     def _process_youtube(self, youtube_data: Dict[str, Any]) -> YouTubeInsights:
         """Convert raw YouTube research data to YouTubeInsights."""
+        # youtube_service emits dicts keyed by the model field names; missing keys take the
+        # model defaults and unknown keys are ignored by model_construct. Transcripts are cut to
+        # what get_youtube_context renders, so processed results don't carry the full text
         videos = [
-            YouTubeVideoResult(
-                title=v.get("title", ""),
-                link=v.get("link", ""),
-                channel=v.get("channel", ""),
-                published_date=v.get("published_date", ""),
-                views=v.get("views"),
-                length=v.get("length", ""),
-                description=v.get("description", ""),
-                video_id=v.get("video_id", ""),
-                transcript=v.get("transcript", ""),
-            )
-            for v in youtube_data.get("videos", [])
+            YouTubeVideoResult.model_construct(**{**v, "transcript": _truncate(v.get("transcript") or "", VIDEO_TRANSCRIPT_CHARS)})
+            for v in youtube_data.get("videos", ())
         ]
         shorts = [
-            YouTubeShortResult(
-                title=s.get("title", ""),
-                link=s.get("link", ""),
-                views=s.get("views"),
-                views_original=s.get("views_original", ""),
-                video_id=s.get("video_id", ""),
-                transcript=s.get("transcript", ""),
-            )
-            for s in youtube_data.get("shorts", [])
+            YouTubeShortResult.model_construct(**{**s, "transcript": _truncate(s.get("transcript") or "", SHORT_TRANSCRIPT_CHARS)})
+            for s in youtube_data.get("shorts", ())
         ]
-        return YouTubeInsights(
+        return YouTubeInsights.model_construct(
             query=youtube_data.get("query", ""),
             videos=videos,
             shorts=shorts,
@@ -132,7 +119,7 @@ class AnalysisService:
         query = category_data.get("query", "")
         results = category_data.get("results", {})
 
-        insights = CategoryInsights(
+        insights = CategoryInsights.model_construct(
             category=category,
             query=query,
         )
@@ -144,11 +131,8 @@ class AnalysisService:
         # Process organic results
         insights.top_results = self._extract_organic_results(results)
 
-        # Process related questions (People Also Ask)
-        insights.related_questions = self._extract_related_questions(results)
-
-        # Process AI overview if available
-        insights.ai_overview = self._extract_ai_overview(results)
+        # Process related questions (People Also Ask) and the AI overview carried in them
+        insights.related_questions, insights.ai_overview = self._extract_questions_and_overview(results)
 
         # Extract key snippets from top results
         insights.key_snippets = self._extract_key_snippets(insights)
@@ -159,165 +143,127 @@ class AnalysisService:
         return insights
 
     def _extract_organic_results(self, results: Dict[str, Any]) -> List[OrganicResult]:
-        """Extract and clean organic search results"""
-        organic_results = []
-        raw_organic = results.get("organic_results", [])
-
-        for item in raw_organic[:self.max_organic_results]:
-            try:
+        """Extract and clean organic search results (model_construct skips validation, so coerce nulls here)"""
+        return [
+            OrganicResult.model_construct(
+                position=item.get("position") or 0,
+                title=item["title"],
+                link=item["link"],
+                snippet=item.get("snippet") or "",
+                source=item.get("source") or "",
                 # Google Forums uses displayed_meta (e.g. "40+ comments · 14 years ago") instead of date
-                date = item.get("date") or item.get("displayed_meta")
-                result = OrganicResult(
-                    position=item.get("position", 0),
-                    title=item.get("title", ""),
-                    link=item.get("link", ""),
-                    snippet=item.get("snippet", ""),
-                    source=item.get("source", ""),
-                    date=date,
-                )
-                if result.title and result.link:  # Only add if has essential fields
-                    organic_results.append(result)
-            except Exception as e:
-                logger.warning(f"Error parsing organic result: {e}")
-
-        return organic_results
+                date=item.get("date") or item.get("displayed_meta"),
+            )
+            for item in islice(results.get("organic_results") or (), self.max_organic_results)
+            if isinstance(item, dict) and item.get("title") and item.get("link")  # Only add if has essential fields
+        ]
 
-    def _extract_related_questions(self, results: Dict[str, Any]) -> List[RelatedQuestion]:
-        """Extract 'People Also Ask' questions and answers"""
+    def _extract_questions_and_overview(self, results: Dict[str, Any]) -> Tuple[List[RelatedQuestion], AIOverview]:
+        """
+        Extract 'People Also Ask' questions and answers, and Google's AI overview, in one pass
+        over related_questions (SerpAPI's ai_overview key is usually just a token/link; the actual
+        content comes from related_questions entries with type "ai_overview").
+        """
         related_questions = []
-        raw_questions = results.get("related_questions", [])
-
-        for item in raw_questions[:self.max_related_questions]:
-            try:
-                # Extract answer from various possible locations
-                answer = self._extract_answer_from_question(item)
-                
-                question = RelatedQuestion(
-                    question=item.get("question", ""),
-                    answer=answer,
-                    source_title=item.get("title"),
-                    source_link=item.get("link"),
-                )
-                if question.question:  # Only add if has a question
-                    related_questions.append(question)
-            except Exception as e:
-                logger.warning(f"Error parsing related question: {e}")
+        ai_overview = AIOverview.model_construct()
+        include_overview = bool(results.get("ai_overview"))
+
+        for idx, item in enumerate(results.get("related_questions", [])):
+            wants_question = idx < self.max_related_questions
+            wants_overview = include_overview and item.get("type") == "ai_overview"
+            if not (wants_question or wants_overview):
+                continue
+            # Text blocks are parsed at most once per item and shared by both consumers
+            blocks = None
+
+            if wants_question:
+                try:
+                    # Prefer the direct snippet; fall back to the text_blocks (AI overview style answers)
+                    answer = item.get("snippet")
+                    if not answer:
+                        blocks = self._parse_text_blocks(item.get("text_blocks", []))
+                        answer = " ".join(f"• {text}" if is_list_item else text for is_list_item, text in blocks)
+                    question = RelatedQuestion.model_construct(
+                        question=item.get("question", ""),
+                        answer=answer,
+                        source_title=item.get("title"),
+                        source_link=item.get("link"),
+                    )
+                    if question.question:  # Only add if has a question
+                        related_questions.append(question)
+                except Exception as e:
+                    logger.warning("Error parsing related question: %s", e)
 
-        return related_questions
+            if wants_overview:
+                if blocks is None:
+                    blocks = self._parse_text_blocks(item.get("text_blocks", []))
+                for is_list_item, text in blocks:
+                    (ai_overview.key_points if is_list_item else ai_overview.snippets).append(text)
 
-    def _extract_answer_from_question(self, item: Dict[str, Any]) -> str:
-        """Extract the answer text from a related question item"""
-        # Check for direct snippet
-        if "snippet" in item and item["snippet"]:
-            return item["snippet"]
+        return related_questions, ai_overview
 
-        # Check for text_blocks (AI overview style answers)
-        text_blocks = item.get("text_blocks", [])
-        answer_parts = []
-        
+    def _parse_text_blocks(self, text_blocks: List[Dict[str, Any]]) -> List[Tuple[bool, str]]:
+        """
+        Flatten SerpAPI text_blocks into (is_list_item, text) pairs in block order.
+        Paragraphs and dict list items are kept only when their snippet is non-empty.
+        """
+        parts = []
         for block in text_blocks:
             block_type = block.get("type", "")
-            
+
             if block_type == "paragraph":
                 snippet = block.get("snippet", "")
                 if snippet:
-                    answer_parts.append(snippet)
-            
+                    parts.append((False, snippet))
+
             elif block_type == "list":
-                list_items = block.get("list", [])
-                for list_item in list_items:
-                    if isinstance(list_item, dict):
+                for list_item in block.get("list", []):
+                    # List items are almost always dicts; plain strings are the rare fallback
+                    try:
                         snippet = list_item.get("snippet", "")
-                        if snippet:
-                            answer_parts.append(f"• {snippet}")
-                    elif isinstance(list_item, str):
-                        answer_parts.append(f"• {list_item}")
-
-        return " ".join(answer_parts) if answer_parts else ""
+                    except AttributeError:
+                        if isinstance(list_item, str):
+                            parts.append((True, list_item))
+                        continue
+                    if snippet:
+                        parts.append((True, snippet))
 
-    def _extract_ai_overview(self, results: Dict[str, Any]) -> AIOverview:
-        """Extract Google's AI overview if available"""
-        ai_overview = AIOverview()
-        raw_ai = results.get("ai_overview", {})
-
-        if not raw_ai:
-            return ai_overview
-
-        # AI overview is usually just a token/link in SerpAPI
-        # The actual content comes from related_questions with type "ai_overview"
-        related_questions = results.get("related_questions", [])
-        
-        for item in related_questions:
-            if item.get("type") == "ai_overview":
-                text_blocks = item.get("text_blocks", [])
-                
-                for block in text_blocks:
-                    block_type = block.get("type", "")
-                    
-                    if block_type == "paragraph":
-                        snippet = block.get("snippet", "")
-                        if snippet:
-                            ai_overview.snippets.append(snippet)
-                    
-                    elif block_type == "list":
-                        list_items = block.get("list", [])
-                        for list_item in list_items:
-                            if isinstance(list_item, dict):
-                                snippet = list_item.get("snippet", "")
-                                if snippet:
-                                    ai_overview.key_points.append(snippet)
-                            elif isinstance(list_item, str):
-                                ai_overview.key_points.append(list_item)
-
-        return ai_overview
+        return parts
 
     def _extract_key_snippets(self, insights: CategoryInsights) -> List[str]:
         """Extract the most relevant text snippets from all sources"""
-        snippets = []
-
-        # Add AI overview snippets (highest quality)
-        snippets.extend(insights.ai_overview.snippets)
-        snippets.extend(insights.ai_overview.key_points)
-
-        # Add related question answers
-        for q in insights.related_questions:
-            if q.answer:
-                # Truncate very long answers
-                answer = q.answer[:500] if len(q.answer) > 500 else q.answer
-                snippets.append(answer)
-
-        # Add top organic result snippets
-        for result in insights.top_results[:5]:
-            if result.snippet:
-                snippets.append(result.snippet)
+        # Candidates in priority order: AI overview (highest quality), related question answers
+        # (very long ones truncated), then top organic result snippets
+        candidates = chain(
+            insights.ai_overview.snippets,
+            insights.ai_overview.key_points,
+            (q.answer[:500] for q in insights.related_questions),
+            (result.snippet for result in islice(insights.top_results, 5)),
+        )
 
-        # Deduplicate while preserving order
+        # Deduplicate case-insensitively while preserving order, in the same pass
         seen = set()
         unique_snippets = []
-        for snippet in snippets:
-            snippet_lower = snippet.lower().strip()
-            if snippet_lower not in seen and len(snippet) > 20:  # Skip very short snippets
-                seen.add(snippet_lower)
+        for snippet in candidates:
+            if len(snippet) <= 20:  # Skip empty and very short snippets
+                continue
+            key = snippet.casefold().strip()
+            if key not in seen:
+                seen.add(key)
                 unique_snippets.append(snippet)
+                if len(unique_snippets) == 15:  # Limit to top 15 snippets
+                    break
 
-        return unique_snippets[:15]  # Limit to top 15 snippets
+        return unique_snippets
 
     def _extract_unique_sources(self, results: List[OrganicResult]) -> List[str]:
-        """Extract unique source domains from results"""
-        sources = set()
-        
+        """Extract unique source domains from results, in first-seen order"""
+        sources: Dict[str, None] = {}
         for result in results:
             if result.source:
-                sources.add(result.source)
-            elif result.link:
-                try:
-                    parsed = urlparse(result.link)
-                    domain = parsed.netloc.replace("www.", "")
-                    if domain:
-                        sources.add(domain)
-                except Exception:
-                    pass
-
+                sources[result.source] = None
+            elif result.link and (match := _DOMAIN_RE.match(result.link)):
+                sources[match.group(1)] = None
         return list(sources)
 
     def get_youtube_context(self, processed: ProcessedSearchResults) -> str:
@@ -328,11 +274,11 @@ class AnalysisService:
         for v in processed.youtube_insights.videos:
             parts.append(f"\n### Video: {v.title} ({v.channel})")
             if v.transcript:
-                parts.append(f"Transcript: {v.transcript[:2000]}{'...' if len(v.transcript) > 2000 else ''}")
+                parts.append("Transcript: " + _truncate(v.transcript, VIDEO_TRANSCRIPT_CHARS))
         for s in processed.youtube_insights.shorts:
             parts.append(f"\n### Short: {s.title}")
             if s.transcript:
-                parts.append(f"Transcript: {s.transcript[:1500]}{'...' if len(s.transcript) > 1500 else ''}")
+                parts.append("Transcript: " + _truncate(s.transcript, SHORT_TRANSCRIPT_CHARS))
         return "\n".join(parts)
 
     def get_combined_context(self, processed: ProcessedSearchResults) -> str:
@@ -340,46 +286,48 @@ class AnalysisService:
         Generate a combined text context from all processed results.
         Useful for feeding into an LLM for synthesis.
         """
-        context_parts = []
+        # Every fragment goes into one list that is joined once; sections are separated by "\n"
+        out: List[str] = []
 
         for insights in processed.get_all_insights():
-            section = f"\n## {insights.category.upper()} RESEARCH\n"
-            section += f"Query: {insights.query}\n"
-            section += f"Total Results: {insights.total_results}\n\n"
+            if out:
+                out.append("\n")
+            out.extend((
+                f"\n## {insights.category.upper()} RESEARCH\n",
+                f"Query: {insights.query}\n",
+                f"Total Results: {insights.total_results}\n\n",
+            ))
 
             # Add AI overview if available
-            if insights.ai_overview.snippets or insights.ai_overview.key_points:
-                section += "### AI Overview:\n"
-                for snippet in insights.ai_overview.snippets:
-                    section += f"{snippet}\n"
-                if insights.ai_overview.key_points:
-                    section += "\nKey Points:\n"
-                    for point in insights.ai_overview.key_points:
-                        section += f"• {point}\n"
-                section += "\n"
+            ai_overview = insights.ai_overview
+            if ai_overview.snippets or ai_overview.key_points:
+                out.append("### AI Overview:\n")
+                out.extend(f"{snippet}\n" for snippet in ai_overview.snippets)
+                if ai_overview.key_points:
+                    out.append("\nKey Points:\n")
+                    out.extend(f"• {point}\n" for point in ai_overview.key_points)
+                out.append("\n")
 
             # Add related questions
             if insights.related_questions:
-                section += "### Related Questions & Answers:\n"
-                for q in insights.related_questions:
-                    section += f"Q: {q.question}\n"
-                    section += f"A: {q.answer}\n\n"
+                out.append("### Related Questions & Answers:\n")
+                out.extend(f"Q: {q.question}\nA: {q.answer}\n\n" for q in insights.related_questions)
 
             # Add top results
             if insights.top_results:
-                section += "### Top Search Results:\n"
-                for result in insights.top_results[:5]:
-                    section += f"- {result.title}\n"
-                    section += f"  {result.snippet}\n"
-                    section += f"  Source: {result.source} | {result.link}\n\n"
-
-            context_parts.append(section)
+                out.append("### Top Search Results:\n")
+                out.extend(
+                    f"- {result.title}\n  {result.snippet}\n  Source: {result.source} | {result.link}\n\n"
+                    for result in islice(insights.top_results, 5)
+                )
 
         youtube_ctx = self.get_youtube_context(processed)
         if youtube_ctx:
-            context_parts.append(youtube_ctx)
+            if out:
+                out.append("\n")
+            out.append(youtube_ctx)
 
-        return "\n".join(context_parts)
+        return "".join(out)
 
     def get_category_summary(self, insights: CategoryInsights) -> Dict[str, Any]:
         """Generate a summary dict for a single category"""
@@ -1,7 +1,9 @@
+import asyncio
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Any, Awaitable, Callable, Optional
+import bcrypt
+from fastapi import BackgroundTasks
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 from src.utils.config import settings
 from src.services.firebase_service import firebase_service
 from src.services.email_service import email_service
@@ -10,18 +12,26 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+
+async def _send_email(label: str, send: Callable[..., Awaitable[Any]], *args: Any) -> None:
+    """Send an email from a response background task (runs before Mangum returns, so Lambda-safe)"""
+    try:
+        await send(*args)
+    except Exception as e:
+        logger.error(f"Failed to send {label} email: {str(e)}")
+
 class AuthService:
     def __init__(self):
-        self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+        self._rounds = settings.BCRYPT_ROUNDS
         self.user_repo = user_repository
     
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
-        """Verify a password against its hash"""
-        return self.pwd_context.verify(plain_password, hashed_password)
+        """Verify a password against its hash (the cost is read from the hash itself)"""
+        return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
     
     def get_password_hash(self, password: str) -> str:
         """Hash a password"""
-        return self.pwd_context.hash(password)
+        return bcrypt.hashpw(password.encode(), bcrypt.gensalt(self._rounds)).decode()
     
     def create_access_token(self, data: dict, expires_delta: Optional[timedelta] = None) -> str:
         """Create JWT access token"""
@@ -46,7 +56,7 @@ class AuthService:
         except JWTError:
             return None
     
-    async def create_user(self, email: str, password: str) -> dict:
+    async def create_user(self, email: str, password: str, background_tasks: BackgroundTasks) -> dict:
         """Create a new user"""
         firebase_user = None
         try:
@@ -58,8 +68,8 @@ class AuthService:
             # Create Firebase user first
             firebase_user = firebase_service.create_user(email, password)
             
-            # Hash password for local storage
-            hashed_password = self.get_password_hash(password)
+            # Hash password for local storage (bcrypt is CPU-bound, keep it off the event loop)
+            hashed_password = await asyncio.to_thread(self.get_password_hash, password)
             
             # Generate verification code
             verification_code = email_service.generate_verification_code()
@@ -74,17 +84,9 @@ class AuthService:
                 verification_expires_at=verification_expires_at
             )
             
-            # Send verification email (non-blocking)
-            try:
-                await email_service.send_verification_email(email, verification_code)
-            except Exception as e:
-                logger.error(f"Failed to send verification email: {str(e)}")
-            
-            # Send welcome email (non-blocking)
-            try:
-                await email_service.send_welcome_email(email)
-            except Exception as e:
-                logger.error(f"Failed to send welcome email: {str(e)}")
+            # Send verification and welcome emails after the response goes out
+            background_tasks.add_task(_send_email, "verification", email_service.send_verification_email, email, verification_code)
+            background_tasks.add_task(_send_email, "welcome", email_service.send_welcome_email, email)
             
             return {
                 "id": user.id,
@@ -112,7 +114,7 @@ class AuthService:
                 return None
             
             # Verify password
-            if not self.verify_password(password, user.password):
+            if not await asyncio.to_thread(self.verify_password, password, user.password):
                 return None
             
             # Check if user is verified
@@ -162,7 +164,7 @@ class AuthService:
             logger.error(f"Failed to verify email: {str(e)}")
             return False
     
-    async def forgot_password(self, email: str) -> bool:
+    async def forgot_password(self, email: str, background_tasks: BackgroundTasks) -> bool:
         """Initiate forgot password process"""
         try:
             user = await self.user_repo.find_by_email(email)
@@ -176,11 +178,8 @@ class AuthService:
             # Update user with reset code
             await self.user_repo.update_verification_code(email, reset_code, reset_expires_at)
             
-            # Send reset email (non-blocking)
-            try:
-                await email_service.send_password_reset_email(email, reset_code)
-            except Exception as e:
-                logger.error(f"Failed to send password reset email: {str(e)}")
+            # Send reset email after the response goes out
+            background_tasks.add_task(_send_email, "password reset", email_service.send_password_reset_email, email, reset_code)
             
             return True
             
@@ -188,7 +187,7 @@ class AuthService:
             logger.error(f"Failed to process forgot password: {str(e)}")
             return False
     
-    async def reset_password(self, email: str, reset_code: str, new_password: str) -> bool:
+    async def reset_password(self, email: str, reset_code: str, new_password: str, background_tasks: BackgroundTasks) -> bool:
         """Reset user password"""
         try:
             user = await self.user_repo.find_by_email(email)
@@ -202,7 +201,7 @@ class AuthService:
                 return False
             
             # Hash new password
-            hashed_password = self.get_password_hash(new_password)
+            hashed_password = await asyncio.to_thread(self.get_password_hash, new_password)
             
             # Update user password
             await self.user_repo.update_password(email, hashed_password)
@@ -214,11 +213,8 @@ class AuthService:
                 except Exception as e:
                     logger.error(f"Failed to update Firebase password: {str(e)}")
             
-            # Send success email (non-blocking)
-            try:
-                await email_service.send_password_reset_success_email(email)
-            except Exception as e:
-                logger.error(f"Failed to send password reset success email: {str(e)}")
+            # Send success email after the response goes out
+            background_tasks.add_task(_send_email, "password reset success", email_service.send_password_reset_success_email, email)
             
             return True
             
@@ -226,7 +222,7 @@ class AuthService:
             logger.error(f"Failed to reset password: {str(e)}")
             return False
     
-    async def resend_verification_code(self, email: str) -> bool:
+    async def resend_verification_code(self, email: str, background_tasks: BackgroundTasks) -> bool:
         """Resend verification code to user email"""
         try:
             user = await self.user_repo.find_by_email(email)
@@ -244,11 +240,8 @@ class AuthService:
             # Update user with new verification code
             await self.user_repo.update_verification_code(email, verification_code, verification_expires_at)
             
-            # Send verification email (non-blocking)
-            try:
-                await email_service.send_verification_email(email, verification_code)
-            except Exception as e:
-                logger.error(f"Failed to send verification email: {str(e)}")
+            # Send verification email after the response goes out
+            background_tasks.add_task(_send_email, "verification", email_service.send_verification_email, email, verification_code)
             
             return True
             
@@ -265,7 +265,8 @@ class ChatbotService:
             "messages": [HumanMessage(content=user_message)]
         }
 
-        full_response = ""
+        # Streamed chunks, joined once after the stream ends
+        response_parts: list[str] = []
 
         # 3. Stream the response
         try:
@@ -273,12 +274,13 @@ class ChatbotService:
                 if messages_chunk := chunk.get("model_call"):
                     if messages_chunk["messages"]:
                         content = messages_chunk["messages"][-1].content
-                        full_response += content
+                        response_parts.append(content)
                         yield content  # Yield the content chunk to the frontend
         except Exception as e:
             logger.error(f"Error during streaming for {thread_id}: {e}")
             yield "Sorry, an error occurred. Please try again."
             return # Stop execution if streaming fails
+        full_response = "".join(response_parts)
 
         # 4. After streaming, extract from the *full history*
         try:
@@ -1,5 +1,3 @@
-import firebase_admin
-from firebase_admin import credentials, auth as firebase_auth
 from src.utils.config import settings
 import logging
 
@@ -8,11 +6,19 @@ logger = logging.getLogger(__name__)
 class FirebaseService:
     def __init__(self):
         self._initialized = False
+        self._auth = None
     
     def _ensure_initialized(self):
-        """Initialize Firebase Admin SDK if not already initialized"""
+        """
+        Initialize Firebase Admin SDK if not already initialized and return its auth module.
+        firebase_admin (and the google-auth stack behind it) is imported here rather than at
+        module import, so cold starts that never touch Firebase don't pay for it.
+        """
         if not self._initialized:
             try:
+                import firebase_admin
+                from firebase_admin import credentials, auth as firebase_auth
+
                 # Check if Firebase is already initialized
                 if not firebase_admin._apps:
                     # Create credentials from environment variables
@@ -35,15 +41,17 @@ class FirebaseService:
                     logger.info("Firebase Admin SDK initialized successfully")
                 else:
                     logger.info("Firebase Admin SDK already initialized")
+                self._auth = firebase_auth
                 self._initialized = True
             except Exception as e:
                 logger.error(f"Failed to initialize Firebase: {str(e)}")
                 raise e
+        return self._auth
     
     def create_user(self, email: str, password: str) -> dict:
         """Create a new user in Firebase Authentication"""
         try:
-            self._ensure_initialized()
+            firebase_auth = self._ensure_initialized()
             user = firebase_auth.create_user(
                 email=email,
                 password=password,
@@ -61,7 +69,7 @@ class FirebaseService:
     def verify_user_email(self, uid: str) -> bool:
         """Mark user email as verified in Firebase"""
         try:
-            self._ensure_initialized()
+            firebase_auth = self._ensure_initialized()
             firebase_auth.update_user(uid, email_verified=True)
             return True
         except Exception as e:
@@ -71,7 +79,7 @@ class FirebaseService:
     def authenticate_user(self, email: str, password: str) -> dict:
         """Authenticate user with Firebase"""
         try:
-            self._ensure_initialized()
+            firebase_auth = self._ensure_initialized()
             # This would typically involve Firebase Auth REST API
             # For now, we'll use a simplified approach
             user = firebase_auth.get_user_by_email(email)
@@ -89,7 +97,7 @@ class FirebaseService:
     def send_password_reset_email(self, email: str) -> bool:
         """Send password reset email using Firebase"""
         try:
-            self._ensure_initialized()
+            firebase_auth = self._ensure_initialized()
             # Generate password reset link
             reset_link = firebase_auth.generate_password_reset_link(email)
             # Note: In a real implementation, you would send this link via email
@@ -103,7 +111,7 @@ class FirebaseService:
     def update_user_password(self, uid: str, new_password: str) -> bool:
         """Update user password in Firebase"""
         try:
-            self._ensure_initialized()
+            firebase_auth = self._ensure_initialized()
             firebase_auth.update_user(uid, password=new_password)
             return True
         except Exception as e:
@@ -113,7 +121,7 @@ class FirebaseService:
     def delete_user(self, uid: str) -> bool:
         """Delete user from Firebase"""
         try:
-            self._ensure_initialized()
+            firebase_auth = self._ensure_initialized()
             firebase_auth.delete_user(uid)
             return True
         except Exception as e:
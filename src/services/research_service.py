@@ -65,17 +65,17 @@ class ResearchService:
             ])
             
             # Find the active session for this thread
-            active_session = await self.repo.find_by_thread_id(threadId)
+            active_session = await self.repo.find_id_by_thread_id(threadId)
             
             if active_session:
                 await self.repo.update_search_params(
-                    session_id=active_session.id,
+                    session_id=active_session['id'],
                     search_params=search_params_results.model_dump() if search_params_results else {}
                 )
             
             return search_params_results
         except Exception as e:
-            logger.error(f"Error generating search params: {e}")
+            logger.error("Error generating search params: %s", e)
             return SearchParams()
 
 
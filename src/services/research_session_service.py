@@ -1,16 +1,27 @@
+import hashlib
 import logging
+from collections import OrderedDict
 from datetime import datetime
-from typing import Optional, Dict, Any
-from src.repositories.research_session_repository import research_session_repository
+from types import MappingProxyType
+from typing import Optional, Dict, Any, List, Mapping
+from src.repositories.research_session_repository import JsonPayload, research_session_repository
 from src.services.database_service import db
 
 logger = logging.getLogger(__name__)
 
+# Completed reports are immutable, so their encoded JSON can be served from memory
+COMPLETED_REPORT_CACHE_SIZE = 256
+
+
 class ResearchSessionService:
     """Service for managing research session state using repository pattern"""
     
     def __init__(self):
         self.research_repo = research_session_repository
+        # session_id: read-only report entry (JSON text and ETag) of a completed session
+        self._completed_reports: OrderedDict[str, Mapping[str, Any]] = OrderedDict()
+        # session_id: buffered intermediate status transitions, flushed by update_status
+        self._status_history: Dict[str, List[Dict[str, str]]] = {}
     
     async def create_session(
         self, 
@@ -31,41 +42,87 @@ class ResearchSessionService:
                 task_ids=task_ids,
                 status='pending'
             )
-            logger.info(f"Created research session {session.id} for thread {thread_id}")
+            logger.info("Created research session %s for thread %s", session.id, thread_id)
             return session.model_dump()
         except Exception as e:
-            logger.error(f"Error creating research session: {e}")
+            logger.error("Error creating research session: %s", e)
             raise
     
+    def append_status(self, session_id: str, status: str) -> None:
+        """
+        Record an intermediate status transition in memory.
+        The timeline is written to the session in a single update by the next update_status call.
+        """
+        self._status_history.setdefault(session_id, []).append(
+            {'status': status, 'at': datetime.utcnow().isoformat()}
+        )
+        logger.info("Session %s advanced to status: %s", session_id, status)
+
+    def discard_status_history(self, session_id: str) -> None:
+        """Drop any buffered status transitions for a session whose run has ended"""
+        self._status_history.pop(session_id, None)
+
     async def update_status(
         self, 
         session_id: str, 
         status: str,
-        error_message: Optional[str] = None
+        error_message: Optional[str] = None,
+        fields: Optional[Dict[str, JsonPayload]] = None
     ) -> Dict[str, Any]:
-        """Update research session status"""
+        """
+        Update research session status, flushing any buffered status history.
+        fields maps snake_case JSON columns (e.g. 'resources_used') to values written in the same update.
+        """
+        # Taken before any await so the buffer is released even if the write fails
+        status_history = self._status_history.pop(session_id, [])
         try:
             if not db.is_connected():
                 await db.connect()
             
-            completed_at = datetime.utcnow() if status == 'completed' else None
+            now = datetime.utcnow()
+            completed_at = now if status == 'completed' else None
+            status_history.append({'status': status, 'at': now.isoformat()})
             
             session = await self.research_repo.update_status(
                 session_id=session_id,
                 status=status,
                 error_message=error_message,
-                completed_at=completed_at
+                completed_at=completed_at,
+                status_history=status_history,
+                fields=fields
             )
-            logger.info(f"Updated session {session_id} to status: {status}")
+            logger.info("Updated session %s to status: %s", session_id, status)
+            return session.model_dump()
+        except Exception as e:
+            logger.error("Error updating session status: %s", e)
+            raise
+    
+    async def save_and_advance(
+        self,
+        session_id: str,
+        status: str,
+        fields: Dict[str, JsonPayload]
+    ) -> Dict[str, Any]:
+        """Save result columns and advance the session status in a single database write"""
+        return await self.update_status(session_id, status, fields=fields)
+    
+    async def save_results(self, session_id: str, **fields: JsonPayload) -> Dict[str, Any]:
+        """Save several result columns (e.g. search_results, processed_results) in one database write"""
+        try:
+            if not db.is_connected():
+                await db.connect()
+            
+            session = await self.research_repo.update_fields(session_id, **fields)
+            logger.info("Saved %s for session %s", ", ".join(fields), session_id)
             return session.model_dump()
         except Exception as e:
-            logger.error(f"Error updating session status: {e}")
+            logger.error("Error saving results: %s", e)
             raise
     
     async def save_search_results(
         self,
         session_id: str,
-        search_results: Dict[str, Any]
+        search_results: JsonPayload
     ) -> Dict[str, Any]:
         """Save raw search results to database"""
         try:
@@ -76,18 +133,18 @@ class ResearchSessionService:
                 session_id=session_id,
                 search_results=search_results
             )
-            logger.info(f"Saved search results for session {session_id}")
+            logger.info("Saved search results for session %s", session_id)
             return session.model_dump()
         except Exception as e:
-            logger.error(f"Error saving search results: {e}")
+            logger.error("Error saving search results: %s", e)
             raise
     
     async def save_processed_results(
         self,
         session_id: str,
-        processed_results: Dict[str, Any]
+        processed_results: JsonPayload
     ) -> Dict[str, Any]:
-        """Save processed results to database"""
+        """Save processed results (Pydantic model or plain dict) to database"""
         try:
             if not db.is_connected():
                 await db.connect()
@@ -96,18 +153,18 @@ class ResearchSessionService:
                 session_id=session_id,
                 processed_results=processed_results
             )
-            logger.info(f"Saved processed results for session {session_id}")
+            logger.info("Saved processed results for session %s", session_id)
             return session.model_dump()
         except Exception as e:
-            logger.error(f"Error saving processed results: {e}")
+            logger.error("Error saving processed results: %s", e)
             raise
     
     async def save_report(
         self,
         session_id: str,
-        report: Dict[str, Any]
+        report: JsonPayload
     ) -> Dict[str, Any]:
-        """Save final report to database"""
+        """Save final report (Pydantic model or plain dict) to database"""
         try:
             if not db.is_connected():
                 await db.connect()
@@ -116,16 +173,16 @@ class ResearchSessionService:
                 session_id=session_id,
                 report=report
             )
-            logger.info(f"Saved report for session {session_id}")
+            logger.info("Saved report for session %s", session_id)
             return session.model_dump()
         except Exception as e:
-            logger.error(f"Error saving report: {e}")
+            logger.error("Error saving report: %s", e)
             raise
 
     async def save_resources_used(
         self,
         session_id: str,
-        resources_used: Dict[str, Any]
+        resources_used: JsonPayload
     ) -> Dict[str, Any]:
         """Save resources used to database"""
         try:
@@ -136,10 +193,10 @@ class ResearchSessionService:
                 session_id=session_id,
                 resources_used=resources_used
             )
-            logger.info(f"Saved resources used for session {session_id}")
+            logger.info("Saved resources used for session %s", session_id)
             return session.model_dump()
         except Exception as e:
-            logger.error(f"Error saving resources used: {e}")
+            logger.error("Error saving resources used: %s", e)
             raise
     
     async def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
@@ -151,7 +208,47 @@ class ResearchSessionService:
             session = await self.research_repo.find_by_id(session_id)
             return session.model_dump() if session else None
         except Exception as e:
-            logger.error(f"Error getting session: {e}")
+            logger.error("Error getting session: %s", e)
+            raise
+    
+    async def get_report(self, session_id: str) -> Optional[Mapping[str, Any]]:
+        """
+        Get a session's status, report and resources_used (raw JSON text) as a read-only mapping.
+        Completed reports also carry an ETag and are cached in memory.
+        """
+        cached = self._completed_reports.get(session_id)
+        if cached is not None:
+            self._completed_reports.move_to_end(session_id)
+            return cached
+
+        try:
+            if not db.is_connected():
+                await db.connect()
+            
+            row = await self.research_repo.find_report_by_id(session_id)
+            if not row:
+                return None
+            completed = row.get("status") == 'completed' and bool(row.get("report"))
+            etag = '"' + hashlib.sha256(row["report"].encode()).hexdigest()[:16] + '"' if completed else None
+            entry = MappingProxyType(dict(row, etag=etag))
+            if completed:
+                self._completed_reports[session_id] = entry
+                if len(self._completed_reports) > COMPLETED_REPORT_CACHE_SIZE:
+                    self._completed_reports.popitem(last=False)
+            return entry
+        except Exception as e:
+            logger.error("Error getting session report: %s", e)
+            raise
+    
+    async def get_latest_completed_report(self) -> Optional[Dict[str, Any]]:
+        """Get the raw report/resources_used JSON text of the latest completed session"""
+        try:
+            if not db.is_connected():
+                await db.connect()
+            
+            return await self.research_repo.find_latest_completed_report()
+        except Exception as e:
+            logger.error("Error getting latest completed report: %s", e)
             raise
     
     async def get_session_by_thread(self, thread_id: str) -> Optional[Dict[str, Any]]:
@@ -163,7 +260,7 @@ class ResearchSessionService:
             session = await self.research_repo.find_by_thread_id(thread_id)
             return session.model_dump() if session else None
         except Exception as e:
-            logger.error(f"Error getting session by thread: {e}")
+            logger.error("Error getting session by thread: %s", e)
             raise
     
     async def save_task_ids(
@@ -180,10 +277,10 @@ class ResearchSessionService:
                 session_id=session_id,
                 task_ids=task_ids
             )
-            logger.info(f"Saved task IDs for session {session_id}")
+            logger.info("Saved task IDs for session %s", session_id)
             return session.model_dump()
         except Exception as e:
-            logger.error(f"Error saving task IDs: {e}")
+            logger.error("Error saving task IDs: %s", e)
             raise
 
 # Singleton instance
@@ -1,114 +1,203 @@
 import asyncio
+import hashlib
 import logging
-from concurrent.futures import ThreadPoolExecutor
-from typing import Optional
+from typing import Any, Dict, Final, Optional
 
-from serpapi import GoogleSearch
+import httpx
+import orjson
+from cachetools import TTLCache
 
 from src.utils.config import settings
 
 logger = logging.getLogger(__name__)
-# Thread pool for running blocking SerpAPI calls
-executor = ThreadPoolExecutor(max_workers=5)
-
-
-class SerpApiService:
-    def search(
-        self,
-        query: str,
-        query_type: str,
-        engine: str = "google",
-        *,
-        device: Optional[str] = None,
-        gl: Optional[str] = None,
-        hl: Optional[str] = None,
-        location: Optional[str] = None,
-        start: Optional[int] = None,
-    ) -> dict:
-        """
-        Run a single SerpAPI search (blocking).
-
-        Args:
-            query: Search query string
-            query_type: Category/type of query (product, competitor, etc.)
-            engine: SerpAPI engine - "google" (default) or "google_forums"
-            device: Optional - desktop, tablet, or mobile (Forums)
-            gl: Optional - country code (e.g., us, uk)
-            hl: Optional - language code (e.g., en, es)
-            location: Optional - geographic location for search
-            start: Optional - result offset for pagination
-        """
-        serp_params = {
-            "api_key": settings.SERPAPI_API_KEY,
-            "engine": engine,
-            "q": query,
-            "output": "json",
-        }
-        if device is not None:
-            serp_params["device"] = device
-        if gl is not None:
-            serp_params["gl"] = gl
-        if hl is not None:
-            serp_params["hl"] = hl
-        if location is not None:
-            serp_params["location"] = location
-        if start is not None:
-            serp_params["start"] = start
-
-        # TODO: remove after debugging
-        if engine == "google_forums":
-            logger.info(f"[REDDIT/FORUMS] Starting search | query_type={query_type} | query={query[:80]}...")
-        search = GoogleSearch(serp_params)
-        results = search.get_dict()
-        # TODO: remove after debugging
-        if engine == "google_forums":
-            organic = results.get("organic_results", [])
-            logger.info(f"[REDDIT/FORUMS] Search complete | query_type={query_type} | organic_results={len(organic)} | status={results.get('search_metadata', {}).get('status')}")
-            for i, r in enumerate(organic[:3]):
-                logger.info(f"[REDDIT/FORUMS]   result[{i+1}] title={r.get('title', '')[:50]}... | source={r.get('source', '')}")
-        return {"query_type": query_type, "query": query, "results": results}
-
-    def search_youtube(self, search_query: str) -> dict:
-        """
-        Run YouTube search via SerpAPI.
-        Returns video_results and shorts_results from the API response.
-        """
-        # TODO: remove after debugging
-        logger.info(f"[YT] SerpAPI search starting | search_query={search_query[:80]}...")
-        serp_params = {
-            "api_key": settings.SERPAPI_API_KEY,
-            "engine": "youtube",
-            "search_query": search_query,
-            "output": "json",
-        }
-        search = GoogleSearch(serp_params)
-        results = search.get_dict()
-        # TODO: remove after debugging
-        vcount = len(results.get("video_results", []))
-        scount = len(results.get("shorts_results", []))
-        logger.info(f"[YT] SerpAPI search complete | videos={vcount} | shorts_sections={scount} | error={results.get('error', 'none')}")
-        return results
+
+SERPAPI_SEARCH_URL = "https://serpapi.com/search.json"
+SERPAPI_ARCHIVE_URL = "https://serpapi.com/searches/{search_id}.json"
+
+# Params shared by every search; per-call params are merged on top with a single dict union
+_BASE_PARAMS: Final[Dict[str, str]] = {
+    "api_key": settings.SERPAPI_API_KEY,
+    "engine": "google",
+    "output": "json",
+}
+
+# Archive polling backoff for async-mode searches (seconds)
+ARCHIVE_POLL_INITIAL_DELAY = 0.5
+ARCHIVE_POLL_MAX_DELAY = 4.0
+
+# Successful search payloads keyed on (engine, normalized query, extra params); SerpAPI calls are paid.
+# Entries are whole raw payloads (stored as-is in searchResults), so the cap stays small to bound memory.
+_search_cache: TTLCache = TTLCache(maxsize=128, ttl=86400)
+
+# YouTube search payloads keyed like _search_cache; results shift faster than web search, so a shorter TTL
+_youtube_cache: TTLCache = TTLCache(maxsize=512, ttl=3600)
+# cache key: in-flight YouTube search task, so concurrent identical searches are coalesced
+_youtube_inflight: Dict[str, "asyncio.Future[Dict[str, Any]]"] = {}
+
+# Shared async HTTP client so SerpAPI calls reuse pooled TLS connections across requests.
+# Created lazily (Lambda-friendly) and closed from the app lifespan on shutdown.
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the shared SerpAPI HTTP client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=httpx.Timeout(30.0),
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=20, keepalive_expiry=60),
+        )
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared SerpAPI HTTP client if it was created."""
+    global _client
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+    _client = None
+
+
+def _search_cache_key(query: str, engine: str, params: Dict[str, Any]) -> str:
+    """Content-address a search by engine, normalized query and any optional params."""
+    extra = "|".join(f"{k}={params[k]}" for k in sorted(params))
+    return hashlib.sha256(f"{engine}|{query.strip().lower()}|{extra}".encode()).hexdigest()
+
+
+def _build_search_params(
+    query: str,
+    engine: str,
+    *,
+    device: Optional[str] = None,
+    gl: Optional[str] = None,
+    hl: Optional[str] = None,
+    location: Optional[str] = None,
+    start: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Build SerpAPI query params, omitting optional params that were not provided."""
+    serp_params = _BASE_PARAMS | {"engine": engine, "q": query}
+    if device is not None:
+        serp_params["device"] = device
+    if gl is not None:
+        serp_params["gl"] = gl
+    if hl is not None:
+        serp_params["hl"] = hl
+    if location is not None:
+        serp_params["location"] = location
+    if start is not None:
+        serp_params["start"] = start
+    return serp_params
+
+
+async def submit_search_async(params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Submit a search in SerpAPI async mode. Returns immediately with the search metadata
+    (including its id); the results are fetched later from the archive endpoint.
+    """
+    response = await get_client().get(SERPAPI_SEARCH_URL, params={**params, "async": "true"})
+    data = orjson.loads(response.content)
+    if response.is_error and "error" not in data:
+        data["error"] = f"HTTP {response.status_code}"
+    return data
+
+
+async def poll_search_async(search_id: str) -> Dict[str, Any]:
+    """
+    Poll the SerpAPI archive until an async-mode search finishes, backing off exponentially.
+    Callers bound the total wait with asyncio.timeout.
+    """
+    url = SERPAPI_ARCHIVE_URL.format(search_id=search_id)
+    delay = ARCHIVE_POLL_INITIAL_DELAY
+    while True:
+        response = await get_client().get(url, params={"api_key": settings.SERPAPI_API_KEY})
+        data = orjson.loads(response.content)
+        if response.is_error or "error" in data:
+            data.setdefault("error", f"HTTP {response.status_code}")
+            return data
+        status = data.get("search_metadata", {}).get("status")
+        if status == "Success":
+            return data
+        if status == "Error":
+            data["error"] = "SerpAPI search failed"
+            return data
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, ARCHIVE_POLL_MAX_DELAY)
+
+
+async def _fetch_youtube_search(search_query: str) -> Dict[str, Any]:
+    """Run one YouTube search request via SerpAPI."""
+    serp_params = _BASE_PARAMS | {"engine": "youtube", "search_query": search_query}
+    response = await get_client().get(SERPAPI_SEARCH_URL, params=serp_params)
+    results = orjson.loads(response.content)
+    if response.is_error and "error" not in results:
+        results["error"] = f"HTTP {response.status_code}"
+    return results
+
+
+async def search_youtube_async(search_query: str, force_refresh: bool = False) -> Dict[str, Any]:
+    """
+    Run YouTube search via SerpAPI over the shared async HTTP client.
+    Returns video_results and shorts_results from the API response.
+    Successful responses are cached for 1h, and concurrent identical searches share one request.
+    """
+    cache_key = _search_cache_key(search_query, "youtube", {})
+    if not force_refresh:
+        cached = _youtube_cache.get(cache_key)
+        if cached is not None:
+            logger.info("[YT] SerpAPI cache hit")
+            return cached
+
+    inflight = _youtube_inflight.get(cache_key)
+    if inflight is None:
+        inflight = asyncio.ensure_future(_fetch_youtube_search(search_query))
+        _youtube_inflight[cache_key] = inflight
+        inflight.add_done_callback(lambda _: _youtube_inflight.pop(cache_key, None))
+    # Shielded so one caller being cancelled does not fail the others waiting on the same search
+    results = await asyncio.shield(inflight)
+    if "error" not in results:
+        _youtube_cache[cache_key] = results
+    return results
 
 
 async def run_serp_search_async(
     query: str,
     query_type: str,
     engine: str = "google",
+    force_refresh: bool = False,
     **kwargs,
 ) -> dict:
     """
-    Run SerpAPI search asynchronously using thread pool executor.
+    Run a single SerpAPI search over the shared async HTTP client.
+    Successful responses are cached in memory for 24h; pass force_refresh to bypass the cache.
+    With SERPAPI_ASYNC_BATCH enabled the search is submitted in SerpAPI async mode and its
+    result polled from the archive, so concurrent callers submit everything up front.
 
     Args:
         query: Search query string
         query_type: Category/type of query
         engine: "google" (default) or "google_forums"
+        force_refresh: Skip the cache lookup and always hit SerpAPI
         **kwargs: Optional Forums params (device, gl, hl, location, start)
     """
-    loop = asyncio.get_running_loop()
-    service = SerpApiService()
-    return await loop.run_in_executor(
-        executor,
-        lambda: service.search(query, query_type, engine, **kwargs),
-    )
+    cache_key = _search_cache_key(query, engine, {k: v for k, v in kwargs.items() if v is not None})
+    if not force_refresh:
+        cached = _search_cache.get(cache_key)
+        if cached is not None:
+            logger.info("SerpAPI cache hit for %s", query_type)
+            return {"query_type": query_type, "query": query, "results": cached}
 
+    params = _build_search_params(query, engine, **kwargs)
+    if settings.SERPAPI_ASYNC_BATCH:
+        results = await submit_search_async(params)
+        if "error" not in results:
+            results = await poll_search_async(results["search_metadata"]["id"])
+        if "error" in results:
+            return {"query_type": query_type, "query": query, "error": results["error"]}
+    else:
+        response = await get_client().get(SERPAPI_SEARCH_URL, params=params)
+        results = orjson.loads(response.content)
+        if response.is_error or "error" in results:
+            error = results.get("error") or f"HTTP {response.status_code}"
+            return {"query_type": query_type, "query": query, "error": error}
+    _search_cache[cache_key] = results
+    return {"query_type": query_type, "query": query, "results": results}
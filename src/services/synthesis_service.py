@@ -122,7 +122,7 @@ Use the research data provided to form your analysis - do not make up informatio
     def _get_llm(self):
         """Get LLM instance with rotated API key"""
         api_key = get_next_groq_key()
-        logger.debug(f"Using GROQ API key ending in ...{api_key[-4:]}")
+        logger.debug("Using GROQ API key ending in ...%s", api_key[-4:])
         return init_chat_model(
             model_provider="groq",
             model=settings.GROQ_MODEL,
@@ -143,9 +143,6 @@ Use the research data provided to form your analysis - do not make up informatio
         """
         report = ResearchReport()
         youtube_context = analysis_service.get_youtube_context(processed_results) if processed_results.youtube_insights else ""
-        # TODO: remove after debugging
-        if youtube_context:
-            logger.info(f"[YT] Synthesis using youtube_context | len={len(youtube_context)} chars")
 
         # Synthesize each section
         if processed_results.product_insights:
@@ -215,7 +212,7 @@ Respond ONLY with valid JSON, no additional text."""
             ])
             return self._parse_response(response.content, ProductAnalysis)
         except Exception as e:
-            logger.error(f"Error synthesizing product analysis: {e}")
+            logger.error("Error synthesizing product analysis: %s", e)
             return ProductAnalysis(summary=f"Error generating analysis: {str(e)}")
 
     async def synthesize_competitors(
@@ -260,7 +257,7 @@ Respond ONLY with valid JSON, no additional text."""
             ])
             return self._parse_response(response.content, CompetitorAnalysis)
         except Exception as e:
-            logger.error(f"Error synthesizing competitor analysis: {e}")
+            logger.error("Error synthesizing competitor analysis: %s", e)
             return CompetitorAnalysis(summary=f"Error generating analysis: {str(e)}")
 
     async def synthesize_audience(
@@ -300,7 +297,7 @@ Respond ONLY with valid JSON, no additional text."""
             ])
             return self._parse_response(response.content, AudienceAnalysis)
         except Exception as e:
-            logger.error(f"Error synthesizing audience analysis: {e}")
+            logger.error("Error synthesizing audience analysis: %s", e)
             return AudienceAnalysis(summary=f"Error generating analysis: {str(e)}")
 
     async def synthesize_campaign(
@@ -340,7 +337,7 @@ Respond ONLY with valid JSON, no additional text."""
             ])
             return self._parse_response(response.content, CampaignRecommendations)
         except Exception as e:
-            logger.error(f"Error synthesizing campaign recommendations: {e}")
+            logger.error("Error synthesizing campaign recommendations: %s", e)
             return CampaignRecommendations(summary=f"Error generating analysis: {str(e)}")
 
     async def synthesize_platform(
@@ -385,7 +382,7 @@ Respond ONLY with valid JSON, no additional text."""
             ])
             return self._parse_response(response.content, PlatformStrategy)
         except Exception as e:
-            logger.error(f"Error synthesizing platform strategy: {e}")
+            logger.error("Error synthesizing platform strategy: %s", e)
             return PlatformStrategy(summary=f"Error generating analysis: {str(e)}")
 
     async def _generate_executive_summary(
@@ -427,7 +424,7 @@ Focus on the most actionable insights and key recommendations."""
             ])
             return response.content
         except Exception as e:
-            logger.error(f"Error generating executive summary: {e}")
+            logger.error("Error generating executive summary: %s", e)
             return "Executive summary could not be generated."
 
     async def _generate_action_items(
@@ -476,7 +473,7 @@ Respond with a JSON array of strings, each being one action item. Example:
             ])
             return self._parse_json_list(response.content)
         except Exception as e:
-            logger.error(f"Error generating action items: {e}")
+            logger.error("Error generating action items: %s", e)
             return ["Review research findings", "Define campaign objectives", "Create initial ad concepts"]
 
     def _build_context(self, insights: CategoryInsights) -> str:
@@ -556,10 +553,10 @@ Respond with a JSON array of strings, each being one action item. Example:
             data = json.loads(content)
             return model_class(**data)
         except json.JSONDecodeError as e:
-            logger.error(f"JSON parse error: {e}\nContent: {content[:500]}")
+            logger.error("JSON parse error: %s\nContent: %s", e, content[:500])
             return model_class()
         except Exception as e:
-            logger.error(f"Model parse error: {e}")
+            logger.error("Model parse error: %s", e)
             return model_class()
 
     def _parse_json_list(self, content: str) -> List[str]:
@@ -581,7 +578,7 @@ Respond with a JSON array of strings, each being one action item. Example:
                 return [str(item) for item in data]
             return []
         except Exception as e:
-            logger.error(f"Error parsing JSON list: {e}")
+            logger.error("Error parsing JSON list: %s", e)
             return []
 
 
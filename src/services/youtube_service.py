@@ -4,19 +4,29 @@ YouTube research service: search videos/shorts via SerpAPI and extract transcrip
 import asyncio
 import logging
 import re
+import threading
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
 from youtube_transcript_api import YouTubeTranscriptApi
 
-from src.services.serpapi_service import SerpApiService
+from src.services.serpapi_service import search_youtube_async
 
 logger = logging.getLogger(__name__)
-executor = ThreadPoolExecutor(max_workers=3)
+# Dedicated pool for transcript fetches: run_youtube_research itself occupies a default-pool thread
+transcript_executor = ThreadPoolExecutor(max_workers=8)
 
 TOP_VIDEOS_COUNT = 3
 TOP_SHORTS_COUNT = 5
 
+# Transcripts never change for a given video, so keep recent ones in-process (LRU by video_id).
+# Entries are full transcripts (the Resources tab shows them untruncated), so the cap stays small
+# to bound memory on a warm container. Accessed from transcript_executor threads, hence the lock.
+TRANSCRIPT_CACHE_SIZE = 256
+_transcript_cache: "OrderedDict[str, str]" = OrderedDict()
+_transcript_cache_lock = threading.Lock()
+
 
 def _extract_video_id(link: str) -> Optional[str]:
     """Extract YouTube video ID from watch URL or shorts URL."""
@@ -34,21 +44,24 @@ def _extract_video_id(link: str) -> Optional[str]:
 
 
 def _fetch_transcript(video_id: str) -> str:
-    """Fetch transcript for a YouTube video. Returns empty string on failure."""
+    """Fetch transcript for a YouTube video (cached by video_id). Returns empty string on failure."""
+    with _transcript_cache_lock:
+        cached = _transcript_cache.get(video_id)
+        if cached is not None:
+            _transcript_cache.move_to_end(video_id)
+            return cached
     try:
         transcript = YouTubeTranscriptApi().fetch(video_id)
         if transcript:
             text = " ".join(s.text for s in transcript)
-            # TODO: remove after debugging
-            logger.info(f"[YT] Transcript fetched | video_id={video_id} | len={len(text)}")
+            with _transcript_cache_lock:
+                _transcript_cache[video_id] = text
+                if len(_transcript_cache) > TRANSCRIPT_CACHE_SIZE:
+                    _transcript_cache.popitem(last=False)
             return text
-        # TODO: remove after debugging
-        logger.warning(f"[YT] Transcript empty | video_id={video_id}")
         return ""
     except Exception as e:
-        logger.warning(f"Could not fetch transcript for {video_id}: {e}")
-        # TODO: remove after debugging
-        logger.warning(f"[YT] Transcript fetch failed | video_id={video_id} | error={e}")
+        logger.warning("Could not fetch transcript for %s: %s", video_id, e)
         return ""
 
 
@@ -63,39 +76,39 @@ def _flatten_shorts(shorts_results: List[Dict[str, Any]]) -> List[Dict[str, Any]
     return flat
 
 
-def run_youtube_research(search_query: str) -> Dict[str, Any]:
+def run_youtube_research(search_query: str, raw: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Search YouTube, get top 3 videos and top 5 shorts, fetch transcripts.
+    From raw YouTube search results, take the top 3 videos and top 5 shorts and fetch transcripts.
     Returns structure compatible with analysis/synthesis.
     """
-    # TODO: remove after debugging
-    logger.info(f"[YT] run_youtube_research starting | query={search_query[:80]}...")
-    service = SerpApiService()
-    raw = service.search_youtube(search_query)
-
     error = raw.get("error")
     if error:
-        logger.error(f"YouTube API error: {error}")
-        # TODO: remove after debugging
-        logger.error(f"[YT] SerpAPI error | error={error}")
+        logger.error("YouTube API error: %s", error)
         return {"query": search_query, "videos": [], "shorts": [], "error": str(error)}
 
     video_results = raw.get("video_results", [])
     shorts_results = raw.get("shorts_results", [])
     flat_shorts = _flatten_shorts(shorts_results)
-    # TODO: remove after debugging
-    logger.info(f"[YT] Parsing results | video_results={len(video_results)} | flat_shorts={len(flat_shorts)}")
 
-    videos_with_transcripts = []
-    for idx, item in enumerate(video_results[:TOP_VIDEOS_COUNT]):
+    video_items = []
+    for item in video_results[:TOP_VIDEOS_COUNT]:
         link = item.get("link", "")
         video_id = _extract_video_id(link)
-        if not video_id:
-            continue
-        transcript = _fetch_transcript(video_id)
+        if video_id:
+            video_items.append((item, link, video_id))
+    short_items = [item for item in flat_shorts[:TOP_SHORTS_COUNT] if item.get("video_id")]
+
+    # Fetch every transcript concurrently instead of one round trip after another
+    transcripts = list(transcript_executor.map(
+        _fetch_transcript,
+        [video_id for _, _, video_id in video_items] + [item["video_id"] for item in short_items],
+    ))
+    video_transcripts = transcripts[:len(video_items)]
+    short_transcripts = transcripts[len(video_items):]
+
+    videos_with_transcripts = []
+    for (item, link, video_id), transcript in zip(video_items, video_transcripts):
         channel = item.get("channel", {}).get("name", "") if isinstance(item.get("channel"), dict) else ""
-        # TODO: remove after debugging
-        logger.info(f"[YT] Video[{idx+1}] | title={item.get('title', '')[:40]}... | channel={channel} | transcript_len={len(transcript)}")
         videos_with_transcripts.append({
             "title": item.get("title", ""),
             "link": link,
@@ -109,13 +122,8 @@ def run_youtube_research(search_query: str) -> Dict[str, Any]:
         })
 
     shorts_with_transcripts = []
-    for idx, item in enumerate(flat_shorts[:TOP_SHORTS_COUNT]):
-        video_id = item.get("video_id")
-        if not video_id:
-            continue
-        transcript = _fetch_transcript(video_id)
-        # TODO: remove after debugging
-        logger.info(f"[YT] Short[{idx+1}] | title={item.get('title', '')[:40]}... | video_id={video_id} | transcript_len={len(transcript)}")
+    for item, transcript in zip(short_items, short_transcripts):
+        video_id = item["video_id"]
         shorts_with_transcripts.append({
             "title": item.get("title", ""),
             "link": item.get("link", ""),
@@ -125,8 +133,6 @@ def run_youtube_research(search_query: str) -> Dict[str, Any]:
             "transcript": transcript,
         })
 
-    # TODO: remove after debugging
-    logger.info(f"[YT] run_youtube_research complete | videos={len(videos_with_transcripts)} | shorts={len(shorts_with_transcripts)}")
     return {
         "query": search_query,
         "videos": videos_with_transcripts,
@@ -134,12 +140,7 @@ def run_youtube_research(search_query: str) -> Dict[str, Any]:
     }
 
 
-async def run_youtube_research_async(search_query: str) -> Dict[str, Any]:
-    """Run YouTube research asynchronously via thread pool."""
-    # TODO: remove after debugging
-    logger.info(f"[YT] run_youtube_research_async invoked | query={search_query[:80]}...")
-    loop = asyncio.get_running_loop()
-    result = await loop.run_in_executor(executor, run_youtube_research, search_query)
-    # TODO: remove after debugging
-    logger.info(f"[YT] run_youtube_research_async done | videos={len(result.get('videos', []))} | shorts={len(result.get('shorts', []))}")
-    return result
+async def run_youtube_research_async(search_query: str, force_refresh: bool = False) -> Dict[str, Any]:
+    """Search YouTube on the shared async client, then fetch transcripts in a worker thread."""
+    raw = await search_youtube_async(search_query, force_refresh=force_refresh)
+    return await asyncio.to_thread(run_youtube_research, search_query, raw)
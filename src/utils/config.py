@@ -23,6 +23,9 @@ class Settings(BaseSettings):
     SECRET_KEY: str = ""
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
+
+    # bcrypt cost factor for new password hashes; existing hashes keep the cost they were made with
+    BCRYPT_ROUNDS: int = 12
     
     # Cookie settings
     COOKIE_SECURE: bool = True  # Will be overridden in __init__
@@ -62,6 +65,8 @@ class Settings(BaseSettings):
     GROQ_API_KEY5: str = ""
 
     SERPAPI_API_KEY: str = ""
+    # Submit searches in SerpAPI async mode and poll the archive for results
+    SERPAPI_ASYNC_BATCH: bool = False
     
     # Feature flags for Celery and Redis
     # Set to False for Lambda (ephemeral filesystem, no background workers)
@@ -69,4 +74,7 @@ class Settings(BaseSettings):
     ENABLE_CELERY: bool = False
     ENABLE_REDIS: bool = False
 
+    # Write search/processed/context/report debug dumps to the working directory (local dev only)
+    ENABLE_DEBUG_FILES: bool = False
+
 settings = Settings()
@@ -0,0 +1,12 @@
+from typing import Any
+
+import orjson
+from fastapi.responses import Response
+
+
+class ORJSONResponse(Response):
+    """JSON response rendered directly by orjson; return it from a route to skip jsonable_encoder"""
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)